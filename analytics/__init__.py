@@ -0,0 +1,5 @@
+from .statistics import StatisticsSummary, compute_summary, compute_group_stats, compute_all, load_statistics
+from .simulation import StakingPlan, BetHistory, SimulationResult, load_history, simulate_bankroll, compare_plans
+
+__all__ = ['StatisticsSummary', 'compute_summary', 'compute_group_stats', 'compute_all', 'load_statistics',
+           'StakingPlan', 'BetHistory', 'SimulationResult', 'load_history', 'simulate_bankroll', 'compare_plans']
@@ -0,0 +1,179 @@
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any
+import numpy as np
+
+from database.bet_database import BetDatabase
+from .statistics import PENDING, WIN, LOSE
+
+STAKING_PLANS = ('flat', 'percentage', 'kelly')
+
+# Quantiles reported for terminal bankroll and maximum drawdown
+QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+
+@dataclass(frozen=True)
+class StakingPlan:
+    """How much to stake on each simulated bet
+
+    flat: value is a fixed stake (capped at the current bankroll)
+    percentage: value is the fraction of the current bankroll to stake
+    kelly: value is the Kelly multiplier (1.0 = full Kelly, 0.25 = quarter Kelly)
+    """
+    kind: str
+    value: float
+
+    def __post_init__(self):
+        if self.kind not in STAKING_PLANS:
+            raise ValueError(f"Unknown staking plan: {self.kind}")
+        if self.value <= 0 or (self.kind == 'percentage' and self.value > 1):
+            raise ValueError(f"Invalid {self.kind} staking value: {self.value}")
+
+
+@dataclass(frozen=True)
+class BetHistory:
+    """Settled bets to resample: decimal odds and return per unit staked"""
+    odds: np.ndarray
+    returns: np.ndarray
+    win_probability: float
+
+    def __len__(self) -> int:
+        return len(self.odds)
+
+
+@dataclass
+class SimulationResult:
+    paths: int
+    bets_per_path: int
+    initial_bankroll: float
+    ruin_probability: float
+    mean_terminal_bankroll: float
+    terminal_quantiles: Dict[float, float] = field(default_factory=dict)
+    drawdown_quantiles: Dict[float, float] = field(default_factory=dict)
+    terminal_bankrolls: Optional[np.ndarray] = None
+    max_drawdowns: Optional[np.ndarray] = None
+
+
+def history_from_columns(columns: Dict[str, np.ndarray]) -> BetHistory:
+    """Build a BetHistory from get_bet_columns arrays, skipping pending bets"""
+    settled = (columns['result'] != PENDING) & (columns['stake'] > 0)
+    odds = columns['odds'][settled]
+    returns = columns['profit'][settled] / columns['stake'][settled]
+    result = columns['result'][settled]
+    wins = np.count_nonzero(result == WIN)
+    decided = wins + np.count_nonzero(result == LOSE)
+    return BetHistory(
+        odds=np.ascontiguousarray(odds, dtype=np.float64),
+        returns=np.ascontiguousarray(returns, dtype=np.float64),
+        win_probability=wins / decided if decided else 0.0,
+    )
+
+
+def load_history(db: BetDatabase, filters: Optional[Dict[str, Any]] = None) -> BetHistory:
+    """Load settled bets from the database for resampling"""
+    return history_from_columns(db.get_bet_columns(('odds', 'stake', 'result', 'profit'), filters))
+
+
+def _kelly_fractions(odds: np.ndarray, win_probability: float) -> np.ndarray:
+    """Full-Kelly fraction per bet, zero where there is no edge"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        fractions = (win_probability * odds - 1.0) / (odds - 1.0)
+    return np.clip(np.nan_to_num(fractions), 0.0, 1.0)
+
+
+# Set in each pool process by _init_worker so the history is pickled once per process
+_worker_history: Optional[BetHistory] = None
+
+
+def _init_worker(history: BetHistory) -> None:
+    global _worker_history
+    _worker_history = history
+
+
+def _simulate_worker_shard(*args):
+    return _simulate_shard(_worker_history, *args)
+
+
+def _simulate_shard(history: BetHistory, plan: StakingPlan, initial_bankroll: float,
+                    bets_per_path: int, paths: int, seed: np.random.SeedSequence,
+                    ruin_level: float):
+    """Simulate one shard of paths; returns (terminal bankrolls, max drawdowns, ruined)"""
+    rng = np.random.default_rng(seed)
+    kelly = _kelly_fractions(history.odds, history.win_probability) if plan.kind == 'kelly' else None
+
+    bankroll = np.full(paths, initial_bankroll, dtype=np.float64)
+    peak = bankroll.copy()
+    max_drawdown = np.zeros(paths)
+    ruined = np.zeros(paths, dtype=bool)
+
+    for _ in range(bets_per_path):
+        picks = rng.integers(0, len(history), paths)
+        if plan.kind == 'flat':
+            stake = np.minimum(plan.value, bankroll)
+        elif plan.kind == 'percentage':
+            stake = bankroll * plan.value
+        else:
+            stake = bankroll * np.minimum(kelly[picks] * plan.value, 1.0)
+        stake[ruined] = 0.0
+
+        bankroll += stake * history.returns[picks]
+        np.maximum(bankroll, 0.0, out=bankroll)
+        np.maximum(peak, bankroll, out=peak)
+        np.maximum(max_drawdown, 1.0 - bankroll / peak, out=max_drawdown)
+        ruined |= bankroll <= ruin_level
+
+    return bankroll, max_drawdown, ruined
+
+
+def simulate_bankroll(history: BetHistory, plan: StakingPlan, initial_bankroll: float = 1000.0,
+                      bets_per_path: int = 500, paths: int = 20000, seed: int = 0,
+                      workers: Optional[int] = None, shard_size: int = 2500,
+                      ruin_fraction: float = 0.05, keep_paths: bool = False) -> SimulationResult:
+    """Monte Carlo bankroll simulation resampling historical bets
+
+    Paths are split into shards of shard_size, each seeded from
+    SeedSequence(seed).spawn(), and run on a ProcessPoolExecutor. Results
+    depend only on seed and shard_size, not on the number of workers.
+    A path is ruined once its bankroll drops to ruin_fraction of the start
+    and stops betting. Drawdowns are fractions of the running peak.
+    """
+    if len(history) == 0:
+        raise ValueError("No settled bets to resample")
+
+    shard_count = math.ceil(paths / shard_size)
+    seeds = np.random.SeedSequence(seed).spawn(shard_count)
+    sizes = [min(shard_size, paths - i * shard_size) for i in range(shard_count)]
+    ruin_level = initial_bankroll * ruin_fraction
+    shard_args = [(plan, initial_bankroll, bets_per_path, size, shard_seed, ruin_level)
+                  for size, shard_seed in zip(sizes, seeds)]
+
+    workers = min(workers or os.cpu_count() or 1, shard_count)
+    if workers == 1:
+        shards = [_simulate_shard(history, *args) for args in shard_args]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(history,)) as executor:
+            shards = list(executor.map(_simulate_worker_shard, *zip(*shard_args)))
+
+    terminal = np.concatenate([shard[0] for shard in shards])
+    drawdowns = np.concatenate([shard[1] for shard in shards])
+    ruined = np.concatenate([shard[2] for shard in shards])
+
+    return SimulationResult(
+        paths=paths,
+        bets_per_path=bets_per_path,
+        initial_bankroll=initial_bankroll,
+        ruin_probability=float(ruined.mean()),
+        mean_terminal_bankroll=float(terminal.mean()),
+        terminal_quantiles=dict(zip(QUANTILES, np.quantile(terminal, QUANTILES).tolist())),
+        drawdown_quantiles=dict(zip(QUANTILES, np.quantile(drawdowns, QUANTILES).tolist())),
+        terminal_bankrolls=terminal if keep_paths else None,
+        max_drawdowns=drawdowns if keep_paths else None,
+    )
+
+
+def compare_plans(history: BetHistory, plans: List[StakingPlan], **kwargs) -> Dict[StakingPlan, SimulationResult]:
+    """Run simulate_bankroll for several plans with the same seed"""
+    return {plan: simulate_bankroll(history, plan, **kwargs) for plan in plans}
@@ -0,0 +1,168 @@
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Any
+import numpy as np
+
+from database.bet_database import BetDatabase
+
+# Result codes as produced by BetDatabase.get_bet_columns
+PENDING = 0
+WIN = BetDatabase.RESULT_CODES['Win']
+LOSE = BetDatabase.RESULT_CODES['Lose']
+CASHED_OUT = BetDatabase.RESULT_CODES['Cashed Out']
+
+# Columns needed by compute_summary/compute_all
+STATISTICS_FIELDS = ('odds', 'stake', 'result', 'profit', 'sport_game_id', 'tournament_id',
+                     'bet_type_id', 'team_a_id', 'team_b_id')
+
+# Groupings offered by compute_group_stats: name -> id column(s)
+GROUPINGS = {
+    'sport_game': ('sport_game_id',),
+    'tournament': ('tournament_id',),
+    'bet_type': ('bet_type_id',),
+    # A bet counts towards both of its teams
+    'team': ('team_a_id', 'team_b_id'),
+}
+
+
+@dataclass
+class StatisticsSummary:
+    """Headline betting metrics"""
+    total_bets: int = 0
+    settled_bets: int = 0
+    pending_bets: int = 0
+    wins: int = 0
+    losses: int = 0
+    cash_outs: int = 0
+    win_rate: float = 0.0          # wins / settled bets, in percent
+    total_stake: float = 0.0
+    profit: float = 0.0
+    yield_pct: float = 0.0         # profit / stake on settled bets, in percent
+    roi_pct: float = 0.0           # mean per-bet profit / stake, in percent
+    average_odds: float = 0.0
+    longest_win_streak: int = 0
+    longest_losing_streak: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def longest_run(mask: np.ndarray) -> int:
+    """Length of the longest run of True values in a boolean array"""
+    if not mask.any():
+        return 0
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return int((ends - starts).max())
+
+
+def compute_summary(columns: Dict[str, np.ndarray]) -> StatisticsSummary:
+    """Compute headline metrics from get_bet_columns arrays (in date order)"""
+    result = columns['result']
+    stake = columns['stake']
+    profit = columns['profit']
+    total = len(result)
+    if total == 0:
+        return StatisticsSummary()
+
+    settled = result != PENDING
+    settled_count = int(np.count_nonzero(settled))
+    wins = int(np.count_nonzero(result == WIN))
+    losses = int(np.count_nonzero(result == LOSE))
+    settled_stake = float(stake[settled].sum())
+    total_profit = float(profit.sum())
+
+    # Streaks only look at settled bets; a cash-out breaks both kinds
+    settled_results = result[settled]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        per_bet_return = np.where(stake[settled] > 0, profit[settled] / stake[settled], 0.0)
+
+    return StatisticsSummary(
+        total_bets=total,
+        settled_bets=settled_count,
+        pending_bets=total - settled_count,
+        wins=wins,
+        losses=losses,
+        cash_outs=int(np.count_nonzero(result == CASHED_OUT)),
+        win_rate=100.0 * wins / settled_count if settled_count else 0.0,
+        total_stake=float(stake.sum()),
+        profit=total_profit,
+        yield_pct=100.0 * total_profit / settled_stake if settled_stake else 0.0,
+        roi_pct=100.0 * float(per_bet_return.mean()) if settled_count else 0.0,
+        average_odds=float(columns['odds'].mean()),
+        longest_win_streak=longest_run(settled_results == WIN),
+        longest_losing_streak=longest_run(settled_results == LOSE),
+    )
+
+
+def compute_group_stats(columns: Dict[str, np.ndarray], grouping: str) -> List[Dict[str, Any]]:
+    """Aggregate bets, stake, profit and wins per id of a grouping (see GROUPINGS)
+
+    Keys are factorised with np.unique and summed with np.bincount, so the
+    cost is one sort of the key column rather than a Python loop per bet.
+    Rows are sorted by profit, best first; missing ids (-1) are skipped.
+    """
+    key_fields = GROUPINGS[grouping]
+    keys = np.concatenate([columns[field] for field in key_fields])
+    repeat = len(key_fields)
+    stake = np.tile(columns['stake'], repeat)
+    profit = np.tile(columns['profit'], repeat)
+    result = np.tile(columns['result'], repeat)
+
+    valid = keys >= 0
+    if not valid.all():
+        keys, stake, profit, result = keys[valid], stake[valid], profit[valid], result[valid]
+    if len(keys) == 0:
+        return []
+
+    unique_keys, inverse = np.unique(keys, return_inverse=True)
+    size = len(unique_keys)
+    bets = np.bincount(inverse, minlength=size)
+    settled = result != PENDING
+    settled_bets = np.bincount(inverse, weights=settled, minlength=size)
+    settled_stake = np.bincount(inverse, weights=np.where(settled, stake, 0.0), minlength=size)
+    stake_sum = np.bincount(inverse, weights=stake, minlength=size)
+    profit_sum = np.bincount(inverse, weights=profit, minlength=size)
+    wins = np.bincount(inverse, weights=result == WIN, minlength=size)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        win_rate = np.where(settled_bets > 0, 100.0 * wins / settled_bets, 0.0)
+        yield_pct = np.where(settled_stake > 0, 100.0 * profit_sum / settled_stake, 0.0)
+
+    order = np.argsort(-profit_sum, kind='stable')
+    return [
+        {
+            'id': int(unique_keys[i]),
+            'bets': int(bets[i]),
+            'wins': int(wins[i]),
+            'win_rate': float(win_rate[i]),
+            'stake': float(stake_sum[i]),
+            'profit': float(profit_sum[i]),
+            'yield_pct': float(yield_pct[i]),
+        }
+        for i in order
+    ]
+
+
+def compute_all(columns: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """Headline summary plus every grouping in GROUPINGS"""
+    return {
+        'summary': compute_summary(columns),
+        'groups': {grouping: compute_group_stats(columns, grouping) for grouping in GROUPINGS},
+    }
+
+
+def load_statistics(db: BetDatabase, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Load bets from the database and compute all statistics, with names attached to group rows"""
+    columns = db.get_bet_columns(STATISTICS_FIELDS, filters)
+    statistics = compute_all(columns)
+    names = {
+        'sport_game': {row[0]: row[1] for row in db.get_all_sport_games()},
+        'tournament': dict(db.get_all_tournaments()),
+        'bet_type': {row[0]: row[1] for row in db.get_all_bet_types()},
+        'team': dict(db.get_all_teams()),
+    }
+    for grouping, rows in statistics['groups'].items():
+        for row in rows:
+            row['name'] = names[grouping].get(row['id'], '—')
+    return statistics
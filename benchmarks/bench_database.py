@@ -0,0 +1,172 @@
+"""Benchmark BetDatabase operations at several dataset sizes
+
+Run from the repository root:
+    python -m benchmarks.bench_database [--sizes 10000 100000 1000000] [--add-bets 100000] [--output results.json]
+
+Datasets come from generate_bet_data fixtures (built on first use and
+reused afterwards); every size is benchmarked on a temporary copy so the
+write benchmarks leave the fixture untouched. Results are printed as JSON.
+"""
+import argparse
+import json
+import platform
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from database.bet_database import BetDatabase
+from generate_bet_data import BetGenerator, ensure_fixture
+from prepopulate_bet_data import SPORTS, ESPORTS, prepopulate_per_item
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+
+
+def latency_stats(samples: List[float]) -> Dict[str, float]:
+    """Mean/p50/p95/max of latency samples in seconds, reported in milliseconds"""
+    ordered = sorted(samples)
+    return {
+        'calls': len(samples),
+        'mean_ms': round(statistics.fmean(samples) * 1000, 3),
+        'p50_ms': round(ordered[len(ordered) // 2] * 1000, 3),
+        'p95_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 3),
+        'max_ms': round(ordered[-1] * 1000, 3),
+    }
+
+
+def time_calls(fn: Callable, args_list: List[tuple], repeat: int = 1) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        for args in args_list:
+            start = time.perf_counter()
+            fn(*args)
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+def bench_add_bet(db: BetDatabase, calls: int) -> Dict[str, float]:
+    """Single-bet inserts through add_bet (one commit each)"""
+    sport = SPORTS[0]
+    bet = {
+        'category': sport['category'], 'sport_game': sport['name'],
+        'team_a': sport['teams'][0], 'team_b': sport['teams'][1],
+        'tournament': sport['tournaments'][0], 'location': None,
+        'bet_type': sport['bet_types'][0]['name'], 'bet_option': 'Team A',
+        'odds': 2.0, 'stake': 10.0, 'result': BetDatabase.RESULT_WIN,
+    }
+    start = time.perf_counter()
+    samples = time_calls(db.add_bet, [(bet,)] * calls)
+    elapsed = time.perf_counter() - start
+    return {**latency_stats(samples), 'bets_per_second': round(calls / elapsed, 1)}
+
+
+def bench_get_all_bets(db: BetDatabase) -> Dict[str, float]:
+    """Full history load: wall time and peak Python allocations"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    bets = db.get_all_bets()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {'rows': len(bets), 'seconds': round(elapsed, 4), 'peak_memory_mb': round(peak / 2 ** 20, 1)}
+
+
+def bench_lookups(db: BetDatabase, repeat: int) -> Dict[str, Dict[str, float]]:
+    """Per-sport catalog lookups used by the New Bet page"""
+    sport_ids = [(row[0],) for row in db.get_all_sport_games()]
+    lookups = {
+        'get_teams_for_sport_game': db.get_teams_for_sport_game,
+        'get_tournaments_for_sport_game': db.get_tournaments_for_sport_game,
+        'get_locations_for_sport_game': db.get_locations_for_sport_game,
+        'get_bet_types_for_sport_game': db.get_bet_types_for_sport_game,
+    }
+    return {name: latency_stats(time_calls(fn, sport_ids, repeat)) for name, fn in lookups.items()}
+
+
+def bench_seeding(workdir: Path) -> Dict[str, float]:
+    """Catalog seeding into an empty database, bulk versus one add_* call per row"""
+    results = {}
+    for name, seed in (('seed_catalog', lambda db: db.seed_catalog(SPORTS + ESPORTS)),
+                       ('per_item', prepopulate_per_item)):
+        path = workdir / f'seed_{name}.db'
+        with BetDatabase(str(path)) as db:
+            start = time.perf_counter()
+            seed(db)
+            results[f'{name}_seconds'] = round(time.perf_counter() - start, 4)
+    return results
+
+
+def bench_add_bets(workdir: Path, count: int) -> Dict[str, float]:
+    """Bulk inserts through add_bets: into an empty history, then backfilled into it
+
+    Bets are generated up front so only add_bets itself is timed. The
+    backfill covers the same period with another seed, so its bets fall
+    before the end of the ledger and the ledger is re-derived.
+    """
+    catalog = SPORTS + ESPORTS
+    results = {'bets': count}
+    path = workdir / 'add_bets.db'
+    with BetDatabase(str(path)) as db:
+        db.seed_catalog(catalog)
+        for name, seed in (('empty', 0), ('backfill', 1)):
+            bets = list(BetGenerator(catalog, seed).generate(count))
+            start = time.perf_counter()
+            db.add_bets(bets)
+            elapsed = time.perf_counter() - start
+            results[name] = {'seconds': round(elapsed, 3), 'bets_per_second': round(count / elapsed, 1)}
+    path.unlink()
+    return results
+
+
+def bench_size(size: int, workdir: Path, add_bet_calls: int, lookup_repeat: int) -> Dict[str, object]:
+    start = time.perf_counter()
+    fixture = ensure_fixture(size)
+    result = {'bets': size, 'fixture_seconds': round(time.perf_counter() - start, 2)}
+
+    path = workdir / f'bench_{size}.db'
+    shutil.copyfile(fixture, path)
+    with BetDatabase(str(path)) as db:
+        result['get_all_bets'] = bench_get_all_bets(db)
+        result['lookups'] = bench_lookups(db, lookup_repeat)
+        result['add_bet'] = bench_add_bet(db, add_bet_calls)
+    path.unlink()
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help="bet counts to benchmark")
+    parser.add_argument('--add-bet-calls', type=int, default=200, help="add_bet calls per size")
+    parser.add_argument('--add-bets', type=int, default=100_000, help="bets per add_bets call")
+    parser.add_argument('--lookup-repeat', type=int, default=20, help="passes over all sports per lookup")
+    parser.add_argument('--output', help="also write the JSON report to this file")
+    args = parser.parse_args()
+
+    report = {
+        'benchmark': 'database',
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'platform': platform.platform(),
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        report['seeding'] = bench_seeding(workdir)
+        report['add_bets'] = bench_add_bets(workdir, args.add_bets)
+        report['sizes'] = [bench_size(size, workdir, args.add_bet_calls, args.lookup_repeat) for size in args.sizes]
+
+    output = json.dumps(report, indent=2)
+    print(output)
+    if args.output:
+        Path(args.output).write_text(output + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
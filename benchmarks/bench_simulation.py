@@ -0,0 +1,46 @@
+"""Benchmark Monte Carlo bankroll simulation scaling across worker processes
+
+Run from the repository root:
+    python -m benchmarks.bench_simulation [--paths 20000] [--bets-per-path 500]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from analytics.simulation import StakingPlan, history_from_columns, simulate_bankroll
+from benchmarks.bench_statistics import synthetic_columns
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--paths', type=int, default=20000)
+    parser.add_argument('--bets-per-path', type=int, default=500)
+    parser.add_argument('--history', type=int, default=100_000, help="synthetic historical bets")
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    history = history_from_columns(synthetic_columns(args.history))
+    plan = StakingPlan('kelly', 0.25)
+    report = {'benchmark': 'simulation', 'paths': args.paths,
+              'bets_per_path': args.bets_per_path, 'runs': []}
+
+    workers = 1
+    baseline = None
+    while workers <= args.max_workers:
+        start = time.perf_counter()
+        simulate_bankroll(history, plan, paths=args.paths, bets_per_path=args.bets_per_path,
+                          workers=workers)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        report['runs'].append({'workers': workers, 'seconds': round(elapsed, 4),
+                               'speedup': round(baseline / elapsed, 2)})
+        workers *= 2
+
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Benchmark the vectorized statistics engine
+
+Run from the repository root:
+    python -m benchmarks.bench_statistics [--bets 1000000] [--db bets.db]
+
+Without --db the columns are synthesised in memory so only the computation
+is timed; with --db the load from SQLite is timed separately.
+"""
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+
+from analytics.statistics import compute_all, STATISTICS_FIELDS
+
+TARGET_SECONDS = 1.0
+
+
+def synthetic_columns(count: int, seed: int = 42) -> dict:
+    """Random bet columns shaped like BetDatabase.get_bet_columns output"""
+    rng = np.random.default_rng(seed)
+    odds = rng.uniform(1.1, 5.0, count)
+    stake = rng.choice([5.0, 10.0, 20.0, 50.0, 100.0], count)
+    result = rng.choice(np.array([0, 1, 2, 3], dtype=np.int8), count, p=[0.05, 0.45, 0.45, 0.05])
+    profit = np.select(
+        [result == 1, result == 2, result == 3],
+        [stake * (odds - 1), -stake, stake * rng.uniform(-0.8, 1.0, count)],
+        0.0,
+    )
+    return {
+        'odds': odds,
+        'stake': stake,
+        'result': result,
+        'profit': profit,
+        'sport_game_id': rng.integers(1, 40, count),
+        'tournament_id': rng.integers(-1, 300, count),
+        'bet_type_id': rng.integers(1, 60, count),
+        'team_a_id': rng.integers(1, 2000, count),
+        'team_b_id': rng.integers(1, 2000, count),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--bets', type=int, default=1_000_000, help="number of synthetic bets")
+    parser.add_argument('--db', help="load columns from this database instead of synthesising them")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs (best is reported)")
+    args = parser.parse_args()
+
+    report = {'benchmark': 'statistics', 'target_seconds': TARGET_SECONDS}
+    if args.db:
+        from database.bet_database import BetDatabase
+        db = BetDatabase(args.db)
+        start = time.perf_counter()
+        columns = db.get_bet_columns(STATISTICS_FIELDS)
+        report['load_seconds'] = round(time.perf_counter() - start, 4)
+        db.close()
+    else:
+        columns = synthetic_columns(args.bets)
+    report['bets'] = len(columns['result'])
+
+    timings = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        compute_all(columns)
+        timings.append(time.perf_counter() - start)
+    report['compute_seconds'] = round(min(timings), 4)
+    report['passed'] = report['compute_seconds'] < TARGET_SECONDS
+
+    print(json.dumps(report, indent=2))
+    return 0 if report['passed'] else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,214 @@
+import atexit
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Environment switches (read once at import)
+ENV_ENABLED = 'BETS_QUERY_STATS'            # "1" to record from startup
+ENV_SLOW_MS = 'BETS_SLOW_QUERY_MS'          # slow-statement threshold, default 100
+ENV_DUMP_PATH = 'BETS_QUERY_STATS_DUMP'     # write the stats to this file at exit
+
+_WHITESPACE = re.compile(r'\s+')
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PARAM_LIST = re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)')
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace and literals so every execution of a statement shares one key"""
+    sql = _STRING.sub('?', sql)
+    sql = _NUMBER.sub('?', sql)
+    sql = _WHITESPACE.sub(' ', sql).strip()
+    return _PARAM_LIST.sub('(?, ...)', sql)
+
+
+class _StatementStats:
+    __slots__ = ('count', 'rows', 'total', 'samples', 'plan')
+
+    def __init__(self, max_samples: int) -> None:
+        self.count = 0
+        self.rows = 0
+        self.total = 0.0
+        # Recent executions as one-element lists, so fetches can add to the latest one
+        self.samples = deque(maxlen=max_samples)
+        self.plan: Optional[List[str]] = None
+
+
+class QueryStats:
+    """Per-statement execution counts, latencies and rows, keyed by normalized SQL
+
+    Latency of a statement covers execute() plus the fetches that follow on
+    the same cursor. Percentiles are computed over the most recent
+    max_samples executions; count, total and rows cover every execution.
+    Statements slower than slow_seconds get their EXPLAIN QUERY PLAN stored
+    (once per statement) and printed.
+    """
+
+    def __init__(self, enabled: bool = False, slow_seconds: float = 0.1, max_samples: int = 1024) -> None:
+        self.enabled = enabled
+        self.slow_seconds = slow_seconds
+        self.max_samples = max_samples
+        self._statements: Dict[str, _StatementStats] = {}
+        self._lock = threading.Lock()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._statements.clear()
+
+    def start(self, sql: str) -> tuple:
+        """Register one execution of sql; returns a handle for add()"""
+        key = normalize_sql(sql)
+        sample = [0.0]
+        with self._lock:
+            stats = self._statements.get(key)
+            if stats is None:
+                stats = self._statements[key] = _StatementStats(self.max_samples)
+            stats.count += 1
+            stats.samples.append(sample)
+        return stats, sample
+
+    def add(self, handle: tuple, seconds: float, rows: int = 0) -> bool:
+        """Add time/rows to an execution; True if it just crossed the slow threshold unexplained"""
+        stats, sample = handle
+        was_slow = sample[0] > self.slow_seconds
+        sample[0] += seconds
+        stats.total += seconds
+        stats.rows += rows
+        return not was_slow and sample[0] > self.slow_seconds and stats.plan is None
+
+    def explain(self, handle: tuple, connection: sqlite3.Connection, sql: str, params=()) -> None:
+        """Store and print the query plan of a slow statement"""
+        stats, sample = handle
+        try:
+            rows = connection.execute(f'EXPLAIN QUERY PLAN {sql}', params).fetchall()
+        except sqlite3.Error as e:
+            stats.plan = [f"EXPLAIN failed: {e}"]
+        else:
+            stats.plan = [row[-1] for row in rows]
+        print(f"Slow query ({sample[0] * 1000:.1f} ms): {normalize_sql(sql)}")
+        for line in stats.plan:
+            print(f"    {line}")
+
+    def snapshot(self) -> List[Dict[str, object]]:
+        """Stats per statement, slowest total first"""
+        with self._lock:
+            items = [(key, stats, sorted(sample[0] for sample in stats.samples))
+                     for key, stats in self._statements.items()]
+        report = []
+        for key, stats, latencies in items:
+            report.append({
+                'sql': key,
+                'count': stats.count,
+                'rows': stats.rows,
+                'total_ms': round(stats.total * 1000, 3),
+                'p50_ms': round(self._percentile(latencies, 0.50) * 1000, 3),
+                'p99_ms': round(self._percentile(latencies, 0.99) * 1000, 3),
+                'max_ms': round(latencies[-1] * 1000, 3) if latencies else 0.0,
+                'plan': stats.plan,
+            })
+        report.sort(key=lambda entry: entry['total_ms'], reverse=True)
+        return report
+
+    @staticmethod
+    def _percentile(ordered: List[float], fraction: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    def dump(self, path: Optional[str] = None) -> str:
+        """Return the snapshot as JSON, also writing it to path if given"""
+        text = json.dumps(self.snapshot(), indent=2)
+        if path:
+            Path(path).write_text(text + '\n')
+        return text
+
+
+class InstrumentedCursor(sqlite3.Cursor):
+    """Cursor that reports execute/fetch timings to the shared QueryStats"""
+
+    _handle = None
+    _sql = None
+    _params = ()
+
+    def execute(self, sql, parameters=()):
+        if not query_stats.enabled:
+            self._handle = None
+            return super().execute(sql, parameters)
+        self._handle, self._sql, self._params = query_stats.start(sql), sql, parameters
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self._finish(time.perf_counter() - start, 0)
+
+    def executemany(self, sql, seq_of_parameters):
+        if not query_stats.enabled:
+            self._handle = None
+            return super().executemany(sql, seq_of_parameters)
+        self._handle, self._sql, self._params = query_stats.start(sql), sql, None
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            self._finish(time.perf_counter() - start, max(self.rowcount, 0))
+
+    def fetchone(self):
+        if self._handle is None:
+            return super().fetchone()
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._finish(time.perf_counter() - start, row is not None)
+        return row
+
+    def fetchmany(self, size=None):
+        size = self.arraysize if size is None else size
+        if self._handle is None:
+            return super().fetchmany(size)
+        start = time.perf_counter()
+        rows = super().fetchmany(size)
+        self._finish(time.perf_counter() - start, len(rows))
+        return rows
+
+    def fetchall(self):
+        if self._handle is None:
+            return super().fetchall()
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._finish(time.perf_counter() - start, len(rows))
+        return rows
+
+    def _finish(self, seconds: float, rows: int) -> None:
+        if query_stats.add(self._handle, seconds, rows) and self._params is not None:
+            # Only plain SELECTs are explained; writes and pragmas would not tell much
+            if self._sql.lstrip().upper().startswith(('SELECT', 'WITH')):
+                query_stats.explain(self._handle, self.connection, self._sql, self._params)
+
+
+class InstrumentedConnection(sqlite3.Connection):
+    """Connection whose cursors (including execute() shortcuts) are InstrumentedCursor"""
+
+    def cursor(self, factory=InstrumentedCursor):
+        return super().cursor(factory)
+
+    # The C shortcuts create a plain cursor, bypassing cursor() above
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+# Process-wide recorder shared by every BetDatabase instance
+query_stats = QueryStats(
+    enabled=os.environ.get(ENV_ENABLED, '') not in ('', '0'),
+    slow_seconds=float(os.environ.get(ENV_SLOW_MS, '100')) / 1000,
+)
+
+if os.environ.get(ENV_DUMP_PATH):
+    atexit.register(query_stats.dump, os.environ[ENV_DUMP_PATH])
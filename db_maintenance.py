@@ -0,0 +1,56 @@
+import argparse
+import time
+from database.bet_database import BetDatabase
+
+
+def rebuild_rollups(db: BetDatabase) -> None:
+    """Recompute the daily P&L rollup tables from the bets table"""
+    db.rebuild_rollups()
+
+
+def rebuild_ledger(db: BetDatabase) -> None:
+    """Re-derive the balance ledger from bets and recorded deposits/withdrawals"""
+    db.rebuild_ledger()
+
+
+def rebuild_search(db: BetDatabase) -> None:
+    """Re-index every bet in the full-text search table"""
+    db.rebuild_search_index()
+
+
+def schema_version(db: BetDatabase) -> None:
+    """Report the applied schema version (opening the database applies pending migrations)"""
+    print(f"Schema version {db.get_schema_version()} of {BetDatabase.SCHEMA_VERSION}")
+
+
+def check_ledger(db: BetDatabase) -> None:
+    """Report differences between the stored ledger and one re-derived from bets"""
+    problems = db.check_ledger()
+    for problem in problems:
+        print(problem)
+    print("Ledger is consistent" if not problems else "Ledger is inconsistent, run rebuild-ledger")
+
+
+COMMANDS = {
+    'rebuild-rollups': rebuild_rollups,
+    'rebuild-ledger': rebuild_ledger,
+    'check-ledger': check_ledger,
+    'rebuild-search': rebuild_search,
+    'schema-version': schema_version,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Maintenance tasks for the betting tracker database")
+    parser.add_argument('command', choices=sorted(COMMANDS))
+    parser.add_argument('--db', default="bets.db", help="Path to the SQLite database (default: bets.db)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    with BetDatabase(args.db) as db:
+        COMMANDS[args.command](db)
+    print(f"{args.command} finished in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
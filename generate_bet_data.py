@@ -0,0 +1,181 @@
+"""Deterministic synthetic bet history for scale testing
+
+    python generate_bet_data.py 100000 --db synthetic.db --seed 7
+
+The catalog from prepopulate_bet_data is seeded first, then N bets are
+streamed through BetDatabase.add_bets in chronological order (so ledger
+rows are appended rather than rebuilt). The same count, seed, day span and
+end date always produce the same bets.
+"""
+import argparse
+import math
+import random
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from database.bet_database import BetDatabase
+from prepopulate_bet_data import SPORTS, ESPORTS
+
+# Fixed end date so fixtures do not depend on when they were generated
+DEFAULT_END_DATE = datetime(2025, 1, 1)
+FIXTURE_DIR = Path(__file__).resolve().parent / 'benchmarks' / 'fixtures'
+
+BOOKMAKER_MARGIN = 0.05     # true win probability = (1 - margin) / odds
+CASH_OUT_RATE = 0.06
+STAKES = [5, 10, 20, 25, 50, 100, 250]
+STAKE_WEIGHTS = [20, 30, 20, 10, 12, 6, 2]
+# Bet types whose option comes with a line (goals, points, handicap)
+LINE_KEYWORDS = ('Over/Under', 'Total', 'Handicap', 'Spread')
+
+
+def _zipf_weights(count: int, exponent: float = 0.8) -> List[float]:
+    """Popularity weights: the first items of a catalog list are the most common"""
+    return [1 / (rank + 1) ** exponent for rank in range(count)]
+
+
+class BetGenerator:
+    """Streams realistic bet dicts for add_bets from a seeded random generator"""
+
+    def __init__(self, catalog: List[Dict], seed: int = 0, days: int = 730,
+                 end_date: datetime = DEFAULT_END_DATE) -> None:
+        self.rng = random.Random(seed)
+        self.sports = [sport for sport in catalog if len(sport.get('teams', [])) >= 2 and sport['bet_types']]
+        self.sport_weights = _zipf_weights(len(self.sports), 1.0)
+        self.team_weights = {sport['name']: _zipf_weights(len(sport['teams'])) for sport in self.sports}
+        self.bet_type_weights = {sport['name']: _zipf_weights(len(sport['bet_types'])) for sport in self.sports}
+        self.end_date = end_date
+        self.start_date = end_date - timedelta(days=days)
+
+    def generate(self, count: int) -> Iterator[Dict]:
+        """Yield count bets with dates spread evenly (plus jitter) over the day span"""
+        span = (self.end_date - self.start_date).total_seconds()
+        pending_after = self.end_date - timedelta(days=1)
+        for i in range(count):
+            date = self.start_date + timedelta(seconds=int(span * (i + self.rng.random()) / count))
+            yield self._bet(date, pending=date >= pending_after)
+
+    def _bet(self, date: datetime, pending: bool) -> Dict:
+        rng = self.rng
+        sport = rng.choices(self.sports, self.sport_weights)[0]
+        team_a, team_b = self._pick_teams(sport)
+        bet_type = rng.choices(sport['bet_types'], self.bet_type_weights[sport['name']])[0]
+        odds = round(min(max(rng.lognormvariate(math.log(1.9), 0.35), 1.01), 15.0), 2)
+        stake = float(rng.choices(STAKES, STAKE_WEIGHTS)[0])
+        if rng.random() < 0.1:
+            stake = round(stake * rng.uniform(0.5, 2.0), 2)
+
+        result = cash_out_amount = None
+        if not pending:
+            if rng.random() < CASH_OUT_RATE:
+                result = BetDatabase.RESULT_CASHED_OUT
+                cash_out_amount = round(stake * rng.uniform(0.3, 0.9 * odds), 2)
+            elif rng.random() < (1 - BOOKMAKER_MARGIN) / odds:
+                result = BetDatabase.RESULT_WIN
+            else:
+                result = BetDatabase.RESULT_LOSE
+
+        return {
+            'category': sport['category'],
+            'sport_game': sport['name'],
+            'team_a': team_a,
+            'team_b': team_b,
+            'tournament': rng.choice(sport['tournaments']) if sport.get('tournaments') else None,
+            'location': rng.choice(sport['locations']) if sport.get('locations') else None,
+            'bet_type': bet_type['name'],
+            'bet_option': self._bet_option(bet_type),
+            'line': self._line(bet_type),
+            'odds': odds,
+            'stake': stake,
+            'result': result,
+            'cash_out_amount': cash_out_amount,
+            'date': date,
+        }
+
+    def _pick_teams(self, sport: Dict) -> tuple:
+        weights = self.team_weights[sport['name']]
+        team_a = self.rng.choices(sport['teams'], weights)[0]
+        team_b = team_a
+        while team_b == team_a:
+            team_b = self.rng.choices(sport['teams'], weights)[0]
+        return team_a, team_b
+
+    def _bet_option(self, bet_type: Dict) -> Optional[str]:
+        if bet_type['type'] == 'dropdown':
+            return self.rng.choice(bet_type['options'])
+        return f"{self.rng.randint(0, 4)}-{self.rng.randint(0, 4)}"
+
+    def _line(self, bet_type: Dict) -> Optional[float]:
+        if any(keyword in bet_type['name'] for keyword in LINE_KEYWORDS):
+            return self.rng.randint(0, 10) + 0.5
+        return None
+
+
+def generate(db_path: str, count: int, seed: int = 0, days: int = 730,
+             end_date: datetime = DEFAULT_END_DATE, chunk_size: int = 5000) -> Dict[str, float]:
+    """Seed the catalog and add count synthetic bets to db_path; returns timings"""
+    catalog = SPORTS + ESPORTS
+    timings = {}
+    with BetDatabase(db_path) as db:
+        start = time.perf_counter()
+        db.seed_catalog(catalog)
+        timings['seed_seconds'] = time.perf_counter() - start
+
+        generator = BetGenerator(catalog, seed, days, end_date)
+        start = time.perf_counter()
+        results = db.add_bets(generator.generate(count), chunk_size=chunk_size)
+        timings['insert_seconds'] = time.perf_counter() - start
+        timings['failed'] = sum(1 for bet_id, _ in results if bet_id == -1)
+    return timings
+
+
+def fixture_path(count: int, seed: int = 0) -> Path:
+    """Location of the reusable fixture database for a bet count and seed"""
+    return FIXTURE_DIR / f'bets_{count}_seed{seed}.db'
+
+
+def ensure_fixture(count: int, seed: int = 0) -> Path:
+    """Return the fixture database for count/seed, generating it on first use
+
+    The database is built under a temporary name and renamed when complete,
+    so an interrupted run never leaves a half-filled fixture behind.
+    """
+    path = fixture_path(count, seed)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix('.partial')
+        partial.unlink(missing_ok=True)
+        generate(str(partial), count, seed)
+        partial.replace(path)
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic bet history")
+    parser.add_argument('count', type=int, help="Number of bets to generate (e.g. 1000 to 10000000)")
+    parser.add_argument('--db', help="Target database (default: the shared fixture under benchmarks/fixtures)")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument('--days', type=int, default=730, help="Days of history to spread the bets over (default: 730)")
+    parser.add_argument('--end-date', type=datetime.fromisoformat, default=DEFAULT_END_DATE,
+                        help="Date of the newest bet, ISO format (default: 2025-01-01)")
+    args = parser.parse_args()
+
+    if args.db:
+        db_path = args.db
+    else:
+        if args.days != 730 or args.end_date != DEFAULT_END_DATE:
+            parser.error("--days/--end-date need --db; fixtures always use the defaults")
+        db_path = str(ensure_fixture(args.count, args.seed))
+        print(f"Fixture: {db_path}")
+        return
+
+    timings = generate(db_path, args.count, args.seed, args.days, args.end_date)
+    rate = args.count / timings['insert_seconds'] if timings['insert_seconds'] else 0
+    print(f"Seeded catalog in {timings['seed_seconds']:.2f}s; "
+          f"added {args.count - timings['failed']} bets in {timings['insert_seconds']:.2f}s "
+          f"({rate:,.0f} bets/s, {timings['failed']} failed)")
+
+
+if __name__ == "__main__":
+    main()
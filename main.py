@@ -1,3 +1,6 @@
+import time
+started_at = time.perf_counter()
+
 from PyQt5.QtWidgets import QApplication
 from ui.main_window import MainWindow
 import sys
@@ -23,7 +26,7 @@ palette.setColor(QPalette.Highlight, QColor(42, 130, 218))
 palette.setColor(QPalette.HighlightedText, QColor(0, 0, 0))
 app.setPalette(palette)
 
-window = MainWindow()
+window = MainWindow(started_at)
 window.show()
 
 sys.exit(app.exec_())
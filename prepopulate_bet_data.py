@@ -1,5 +1,7 @@
 from database.bet_database import BetDatabase
+import argparse
 import json
+import time
 
 # --- Comprehensive Sports and Esports Data ---
 
@@ -421,27 +423,41 @@ ESPORTS = [
     },
 ]
 
-def prepopulate():
-    with BetDatabase() as db:
-        for sport in SPORTS + ESPORTS:
-            sport_game_id = db.add_sport_game(sport['name'], sport['category'])
-            # Bet types
-            for bt in sport['bet_types']:
-                bet_type_id = db.add_bet_type(bt['name'], sport_game_id, "")
-                if bt['type'] == 'dropdown':
-                    db.add_bet_type_option(bet_type_id, 'dropdown', options=json.dumps(bt['options']), placeholder=None)
-                elif bt['type'] == 'text':
-                    db.add_bet_type_option(bet_type_id, 'text', options=None, placeholder=bt.get('placeholder', 'Enter bet option'))
-            # Teams
-            for team in sport.get('teams', []):
-                db.add_team(team, sport_game_id)
-            # Locations
-            for location in sport.get('locations', []):
-                db.add_location(location, sport_game_id)
-            # Tournaments
-            for tournament in sport.get('tournaments', []):
-                db.add_tournament(tournament, sport_game_id)
-    print("Prepopulation complete!")
+def prepopulate_per_item(db: BetDatabase) -> None:
+    """Original seeding path: one add_* call (and commit) per catalog row"""
+    for sport in SPORTS + ESPORTS:
+        sport_game_id = db.add_sport_game(sport['name'], sport['category'])
+        # Bet types
+        for bt in sport['bet_types']:
+            bet_type_id = db.add_bet_type(bt['name'], sport_game_id, "")
+            if bt['type'] == 'dropdown':
+                db.add_bet_type_option(bet_type_id, 'dropdown', options=json.dumps(bt['options']), placeholder=None)
+            elif bt['type'] == 'text':
+                db.add_bet_type_option(bet_type_id, 'text', options=None, placeholder=bt.get('placeholder', 'Enter bet option'))
+        # Teams
+        for team in sport.get('teams', []):
+            db.add_team(team, sport_game_id)
+        # Locations
+        for location in sport.get('locations', []):
+            db.add_location(location, sport_game_id)
+        # Tournaments
+        for tournament in sport.get('tournaments', []):
+            db.add_tournament(tournament, sport_game_id)
+
+def prepopulate(db_path: str = "bets.db", per_item: bool = False):
+    start = time.perf_counter()
+    with BetDatabase(db_path) as db:
+        if per_item:
+            prepopulate_per_item(db)
+            summary = "per-item"
+        else:
+            inserted = db.seed_catalog(SPORTS + ESPORTS)
+            summary = ", ".join(f"{count} {table}" for table, count in inserted.items())
+    print(f"Prepopulation complete in {time.perf_counter() - start:.3f}s ({summary})")
 
 if __name__ == "__main__":
-    prepopulate() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Seed the sports/esports catalog")
+    parser.add_argument('--db', default="bets.db", help="Path to the SQLite database (default: bets.db)")
+    parser.add_argument('--per-item', action='store_true', help="Use the slow one-call-per-row path (for comparison)")
+    args = parser.parse_args()
+    prepopulate(args.db, args.per_item)
@@ -0,0 +1,52 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database.bet_database import BetDatabase  # noqa: E402
+
+CATALOG = [{
+    'name': 'Testball',
+    'category': 'Sport',
+    'bet_types': [{'name': 'Match Winner', 'type': 'dropdown', 'options': ['Team A', 'Team B']}],
+    'teams': ['Testballers', 'Rivals'],
+    'tournaments': ['Test Cup'],
+    'locations': ['Test Arena'],
+}]
+
+
+def make_bet(**overrides):
+    """A valid add_bet/add_bets dict for the CATALOG sport"""
+    bet = {
+        'category': 'Sport',
+        'sport_game': 'Testball',
+        'team_a': 'Testballers',
+        'team_b': 'Rivals',
+        'tournament': 'Test Cup',
+        'location': 'Test Arena',
+        'bet_type': 'Match Winner',
+        'bet_option': 'Team A',
+        'line': None,
+        'odds': 2.0,
+        'stake': 10.0,
+        'result': BetDatabase.RESULT_WIN,
+        'cash_out_amount': None,
+        'date': '2024-01-01 10:00:00',
+    }
+    bet.update(overrides)
+    return bet
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / 'bets.db')
+
+
+@pytest.fixture
+def db(db_path):
+    database = BetDatabase(db_path)
+    database.seed_catalog(CATALOG)
+    yield database
+    database.close()
@@ -0,0 +1,298 @@
+import shutil
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+
+from database.bet_database import BetDatabase
+from conftest import CATALOG, make_bet
+
+
+def bet_count(db: BetDatabase) -> int:
+    return db._read_cursor().execute('SELECT COUNT(*) FROM bets').fetchone()[0]
+
+
+# --- add_bets ---
+def test_add_bets_returns_one_result_per_input(db):
+    results = db.add_bets([
+        make_bet(),
+        make_bet(sport_game='Nope'),
+        make_bet(stake=None),
+        make_bet(odds=1.5),
+    ])
+    assert len(results) == 4
+    assert results[0][1] is None and results[3][1] is None
+    assert results[3][0] == results[0][0] + 1
+    assert results[1] == (-1, "Invalid sport/game: Nope")
+    assert results[2] == (-1, "Missing required field: stake")
+    assert bet_count(db) == 2
+
+
+def test_add_bets_rejects_non_numeric_amounts(db):
+    results = db.add_bets([make_bet(stake='10'), make_bet()])
+    assert results[0] == (-1, "Invalid stake: '10'")
+    assert results[1][1] is None
+    assert not db.conn.in_transaction
+    assert bet_count(db) == 1
+
+
+def test_add_bets_rolls_back_when_input_fails(db):
+    def bets():
+        yield make_bet()
+        yield make_bet()
+        raise RuntimeError("broken input")
+
+    results = db.add_bets(bets(), chunk_size=1)
+    assert results and all(result == (-1, "broken input") for result in results)
+    assert not db.conn.in_transaction
+    assert bet_count(db) == 0
+    # The connection is usable afterwards and nothing orphaned gets committed
+    assert db.add_bet(make_bet()) > 0
+    assert bet_count(db) == 1
+
+
+def test_add_bets_reports_every_bet_when_database_is_locked(db_path, db):
+    blocker = sqlite3.connect(db_path)
+    blocker.execute('BEGIN IMMEDIATE')
+    try:
+        locked = BetDatabase(db_path, busy_timeout=0.05)
+        results = locked.add_bets([make_bet(), make_bet(), make_bet()])
+        locked.close()
+    finally:
+        blocker.rollback()
+        blocker.close()
+    assert len(results) == 3
+    assert all(bet_id == -1 and 'locked' in error for bet_id, error in results)
+
+
+# --- Connections ---
+@pytest.fixture
+def wal_db(db_path):
+    database = BetDatabase(db_path, wal=True)
+    database.seed_catalog(CATALOG)
+    yield database
+    database.close()
+
+
+def test_writes_succeed_during_an_open_read(db):
+    db.add_bets([make_bet(), make_bet()])
+    for _ in db.iter_bets(batch_size=1):
+        assert db.add_bet(make_bet()) != -1
+    assert bet_count(db) == 4
+    assert not db._readers
+
+
+def test_reader_connections_are_reused_per_thread(wal_db):
+    db = wal_db
+    db.add_bets([make_bet()])
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        counts = list(pool.map(lambda _: bet_count(db), range(200)))
+    assert counts == [1] * 200
+    assert len(db._readers) <= 2
+
+
+def test_owner_thread_does_not_see_uncommitted_writes(wal_db):
+    db = wal_db
+    db.add_bets([make_bet()])
+    written, release = threading.Event(), threading.Event()
+
+    def pending_write():
+        with db._writer() as cursor:
+            cursor.execute('BEGIN IMMEDIATE')
+            cursor.execute('DELETE FROM bets')
+            written.set()
+            release.wait(5)
+            db.conn.rollback()
+
+    writer = threading.Thread(target=pending_write)
+    writer.start()
+    try:
+        assert written.wait(5)
+        assert bet_count(db) == 1
+    finally:
+        release.set()
+        writer.join()
+    assert bet_count(db) == 1
+
+
+# --- Rollups ---
+def rollup_rows(db: BetDatabase) -> list:
+    rows = db._read_cursor().execute('SELECT * FROM daily_rollups ORDER BY day, sport_game_id, bet_type_id').fetchall()
+    return [tuple(round(value, 6) if isinstance(value, float) else value for value in row) for row in rows]
+
+
+def test_incremental_rollups_match_rebuild(db):
+    db.add_bets([
+        make_bet(date='2024-01-01 09:00:00'),
+        make_bet(date='2024-01-01 18:00:00', result=BetDatabase.RESULT_LOSE, stake=5.0),
+        make_bet(date='2024-01-02 12:00:00', result=BetDatabase.RESULT_CASHED_OUT, cash_out_amount=7.5),
+        make_bet(date='2023-12-31 23:59:00', result=None, odds=3.1),
+    ])
+    db.add_bet(make_bet(result=BetDatabase.RESULT_WIN, stake=2.5, odds=1.8))
+    cursor = db._read_cursor()
+    with db._writer() as writer:
+        writer.execute("UPDATE bets SET result = ? WHERE date LIKE '2023-12-31%'", (BetDatabase.RESULT_WIN,))
+        writer.execute("DELETE FROM bets WHERE stake = 5.0")
+        db.conn.commit()
+    incremental = rollup_rows(db)
+    assert incremental
+
+    db.rebuild_rollups()
+    assert rollup_rows(db) == incremental
+    totals = db.get_rollups(group_by=())[0]
+    assert totals['bets'] == cursor.execute('SELECT COUNT(*) FROM bets').fetchone()[0] == 4
+
+
+# --- Ledger ---
+def test_backdated_deposit_and_withdrawal_are_kept(db):
+    db.add_bets([make_bet(date='2024-01-01 10:00:00')])
+    assert db.get_balance() == 10.0
+    db.add_deposit(100, date=datetime(2023, 1, 1))
+    db.add_withdrawal(30, date=datetime(2023, 6, 1))
+    assert db.get_balance() == 80.0
+    assert db.get_balance('2023-03-01') == 100.0
+    assert db.check_ledger() == []
+    kinds = [row[0] for row in db._read_cursor().execute('SELECT kind FROM ledger ORDER BY id')]
+    assert kinds == ['deposit', 'withdrawal', 'stake', 'payout']
+
+
+def test_ledger_consistent_after_backdated_bets(db):
+    db.add_deposit(50, date=datetime(2024, 2, 1))
+    db.add_bet(make_bet(result=BetDatabase.RESULT_LOSE))
+    db.add_bets([
+        make_bet(date='2024-01-15 12:00:00', result=BetDatabase.RESULT_LOSE, stake=5.0),
+        make_bet(date='2024-03-01 12:00:00', result=BetDatabase.RESULT_CASHED_OUT, cash_out_amount=4.0),
+    ])
+    assert db.check_ledger() == []
+    # 50 deposit, -10 (today's loss), -5 (loss), -10 + 4 (cash out)
+    assert abs(db.get_balance() - 29.0) < 1e-9
+    stored = db._read_cursor().execute('SELECT date, kind, amount, balance FROM ledger ORDER BY id').fetchall()
+    db.rebuild_ledger()
+    assert db._read_cursor().execute('SELECT date, kind, amount, balance FROM ledger ORDER BY id').fetchall() == stored
+
+
+def test_balance_on_a_date_includes_the_whole_day(db):
+    db.add_bets([make_bet(date='2024-01-01 10:00:00', result=BetDatabase.RESULT_LOSE)])
+    assert db.get_balance('2023-12-31') == 0.0
+    assert db.get_balance('2024-01-01') == -10.0
+    assert db.get_balance(date(2024, 1, 1)) == -10.0
+    assert db.get_balance('2024-01-01 09:00:00') == 0.0
+    assert db.get_balance(datetime(2024, 1, 1, 11)) == -10.0
+    assert db.get_balance('2024-01-01T09:00') == 0.0
+    assert db.get_balance('2024-01-01T10:00') == -10.0
+
+
+def test_balance_series_date_to_is_inclusive(db):
+    db.add_bets([make_bet(date='2024-01-01 10:00:00'), make_bet(date='2024-01-02 10:00:00')])
+    assert [day for day, _ in db.get_balance_series(date_to='2024-01-01')] == ['2024-01-01']
+    assert [row['day'] for row in db.get_rollups(date_to='2024-01-01')] == ['2024-01-01']
+
+
+def test_backfill_rebuilds_the_ledger_once_per_call(db, monkeypatch):
+    db.add_bet(make_bet())
+    rebuilds = []
+    rebuild = db._rebuild_ledger
+    monkeypatch.setattr(db, '_rebuild_ledger', lambda cursor: rebuilds.append(1) or rebuild(cursor))
+    db.add_bets([make_bet(date=f'2024-01-{day:02d} 10:00:00') for day in range(1, 11)], chunk_size=2)
+    assert len(rebuilds) == 1
+    assert db.check_ledger() == []
+
+
+# --- Paging ---
+def all_pages(db: BetDatabase, **kwargs) -> list:
+    ids, after = [], None
+    while True:
+        page = db.get_bets_page(after=after, limit=7, **kwargs)
+        ids.extend(bet['id'] for bet in page['bets'])
+        after = page['next_cursor']
+        if after is None:
+            return ids
+
+
+@pytest.mark.parametrize('descending', [True, False])
+@pytest.mark.parametrize('order_by', ['date', 'odds', 'stake'])
+def test_keyset_pages_have_no_duplicates_or_gaps(db, order_by, descending):
+    # Few distinct values, so most page boundaries fall inside a run of ties
+    db.add_bets([
+        make_bet(date=f'2024-01-{1 + i % 3:02d} 12:00:00', odds=1.5 + i % 4, stake=float(1 + i % 2),
+                 result=BetDatabase.RESULT_WIN if i % 5 else BetDatabase.RESULT_LOSE)
+        for i in range(50)
+    ])
+    rows = db._read_cursor().execute(f'SELECT id, {order_by}, result FROM bets').fetchall()
+    expected = [row[0] for row in sorted(rows, key=lambda row: (row[1], row[0]), reverse=descending)]
+    assert all_pages(db, order_by=order_by, descending=descending) == expected
+
+    losses = [row[0] for row in sorted(rows, key=lambda row: (row[1], row[0]), reverse=descending)
+              if row[2] == BetDatabase.RESULT_LOSE]
+    assert all_pages(db, order_by=order_by, descending=descending,
+                     filters={'result': BetDatabase.RESULT_LOSE}) == losses
+
+
+# --- Migrations ---
+REPO_DB = Path(__file__).resolve().parent.parent / 'bets.db'
+
+
+@pytest.fixture
+def legacy_db_path(tmp_path):
+    """Copy of the committed bets.db (user_version 0) with a few bets written the old way"""
+    path = tmp_path / 'legacy.db'
+    shutil.copyfile(REPO_DB, path)
+    conn = sqlite3.connect(path)
+    assert conn.execute('PRAGMA user_version').fetchone()[0] == 0
+    sport_game_id, bet_type_id = conn.execute(
+        'SELECT sport_game_id, id FROM bet_types WHERE sport_game_id IS NOT NULL ORDER BY id LIMIT 1'
+    ).fetchone()
+    conn.executemany('INSERT INTO teams (name, sport_game_id) VALUES (?, ?)',
+                     [('Legacy A', sport_game_id), ('Legacy B', sport_game_id)])
+    team_a, team_b = (row[0] for row in conn.execute("SELECT id FROM teams WHERE name LIKE 'Legacy %' ORDER BY name"))
+    conn.executemany(
+        'INSERT INTO bets (category, sport_game_id, team_a_id, team_b_id, bet_type_id, odds, stake, result, '
+        'cash_out_amount, date) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+        [('Sport', sport_game_id, team_a, team_b, bet_type_id, 2.0, 10.0, result, cash_out, f'2024-01-0{day} 12:00:00')
+         for day, result, cash_out in ((1, 'Win', None), (2, 'Lose', None), (3, 'Cashed Out', 6.0), (4, None, None))]
+    )
+    conn.commit()
+    conn.close()
+    return str(path)
+
+
+def test_migrates_version_0_database(legacy_db_path):
+    with BetDatabase(legacy_db_path) as db:
+        assert db.get_schema_version() == BetDatabase.SCHEMA_VERSION
+        assert bet_count(db) == 4
+        # Backfilled rollups, ledger and search index agree with the bets
+        totals = db.get_rollups(group_by=())[0]
+        assert (totals['bets'], totals['wins'], totals['losses'], totals['cash_outs']) == (4, 1, 1, 1)
+        incremental = rollup_rows(db)
+        db.rebuild_rollups()
+        assert rollup_rows(db) == incremental
+        assert db.check_ledger() == []
+        assert abs(db.get_balance() - (10.0 - 10.0 - 4.0 - 10.0)) < 1e-9
+        assert len(db.search_bets('Legacy')) == 4
+    with BetDatabase(legacy_db_path) as db:
+        assert db.get_schema_version() == BetDatabase.SCHEMA_VERSION
+        assert bet_count(db) == 4
+
+
+def test_refuses_newer_schema(db_path):
+    BetDatabase(db_path).close()
+    conn = sqlite3.connect(db_path)
+    conn.execute(f'PRAGMA user_version = {BetDatabase.SCHEMA_VERSION + 1}')
+    conn.close()
+    with pytest.raises(sqlite3.DatabaseError, match='newer'):
+        BetDatabase(db_path)
+
+
+# --- Catalog ---
+def test_catalog_usage_counts_each_reference(db):
+    db.add_bets([make_bet(), make_bet(team_b='Testballers', location=None), make_bet(tournament=None)])
+    usage = {table: {name: uses for _, _, name, uses in db.get_catalog_usage(table)}
+             for table in ('teams', 'tournaments', 'locations')}
+    assert usage == {
+        'teams': {'Testballers': 4, 'Rivals': 2},
+        'tournaments': {'Test Cup': 2},
+        'locations': {'Test Arena': 2},
+    }
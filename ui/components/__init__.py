@@ -1,3 +1,7 @@
 from .summary_card import SummaryCard
+from .prefix_completer import PrefixCompleter, PrefixCompleterModel
+from .bet_history_model import BetHistoryModel
+from .bet_table import BetTable, BetListModel, HoverRowDelegate
 
-__all__ = ['SummaryCard'] 
\ No newline at end of file
+__all__ = ['SummaryCard', 'PrefixCompleter', 'PrefixCompleterModel', 'BetHistoryModel',
+           'BetTable', 'BetListModel', 'HoverRowDelegate']
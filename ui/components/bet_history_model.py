@@ -0,0 +1,209 @@
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt5.QtGui import QColor
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+from ..services.data_service import DataService
+from ..utils.formatters import Formatters
+from database.bet_database import BetDatabase
+
+
+class BetHistoryModel(QAbstractTableModel):
+    """Bet history read page by page from BetDatabase.get_bets_page
+
+    Rows are appended PAGE_SIZE at a time as the view scrolls to the end
+    (canFetchMore/fetchMore). For every page fetched so far only its start
+    cursor is kept; the rows themselves live in an LRU of CACHE_PAGES
+    pages, and an evicted page is re-read from its start cursor when it
+    scrolls back into view. Sorting and filtering run in SQL, so memory
+    stays flat however far the user scrolls.
+    """
+
+    PAGE_SIZE = 200
+    CACHE_PAGES = 8
+
+    HEADERS = ["Date", "Match", "Tournament", "Bet", "Odds", "Stake", "Result", "Profit/Loss"]
+    # Sortable columns -> get_bets_page order
+    SORT_ORDERS = {0: 'date', 4: 'odds', 5: 'stake'}
+    COLUMN_ODDS, COLUMN_STAKE, COLUMN_RESULT, COLUMN_PROFIT = 4, 5, 6, 7
+
+    loading_changed = pyqtSignal(bool)
+
+    def __init__(self, data_service: DataService, parent=None) -> None:
+        super().__init__(parent)
+        # Not self.data: that would shadow QAbstractTableModel.data()
+        self.data_service = data_service
+        self.filters: Dict[str, Any] = {}
+        self.order_by = 'date'
+        self.descending = True
+        # Bumped on every reset; results of requests from older generations are dropped
+        self._generation = 0
+        self._page_starts: List[Optional[str]] = []
+        self._next_cursor: Optional[str] = None
+        self._exhausted = False
+        self._row_count = 0
+        self._pages: 'OrderedDict[int, List[tuple]]' = OrderedDict()
+        self._requested = set()  # pages being fetched; -1 is the next unseen page
+
+    # --- Model interface ---
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter)
+        if role not in (Qt.DisplayRole, Qt.ForegroundRole):
+            return None
+        row = self._row(index.row())
+        if row is None:
+            return "…" if role == Qt.DisplayRole else None
+        texts, colors, _ = row
+        if role == Qt.DisplayRole:
+            return texts[index.column()]
+        color = colors.get(index.column())
+        return QColor(color) if color else None
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid() or self._exhausted or -1 in self._requested:
+            return
+        self._requested.add(-1)
+        self.loading_changed.emit(True)
+        cursor = self._next_cursor if self._page_starts else None
+        self._request('bet_history_more', cursor, lambda page: self._append_page(cursor, page))
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        if column not in self.SORT_ORDERS:
+            return
+        self.order_by = self.SORT_ORDERS[column]
+        self.descending = order == Qt.DescendingOrder
+        self.reload()
+
+    # --- Queries ---
+    def set_filters(self, filters: Dict[str, Any]) -> None:
+        """Filter with get_bets_page filters (see BetDatabase._build_bet_filters) and reload"""
+        self.filters = {key: value for key, value in filters.items() if value is not None}
+        self.reload()
+
+    def reload(self) -> None:
+        """Drop every loaded row and start again from the first page"""
+        self.beginResetModel()
+        self._generation += 1
+        self._page_starts = []
+        self._next_cursor = None
+        self._exhausted = False
+        self._row_count = 0
+        self._pages.clear()
+        self._requested.clear()
+        self.endResetModel()
+        self.fetchMore()
+
+    def bet(self, row: int) -> Optional[Dict[str, Any]]:
+        """The bet shown in a row, if its page is loaded"""
+        cached = self._row(row, request=False)
+        return cached[2] if cached else None
+
+    def _request(self, channel: Optional[str], cursor: Optional[str], on_page) -> None:
+        generation = self._generation
+
+        def deliver(page: Dict[str, Any]) -> None:
+            if generation == self._generation:
+                on_page(page)
+
+        def failed(message: str) -> None:
+            if generation == self._generation:
+                self._requested.clear()
+                self.loading_changed.emit(False)
+                print(f"Error loading bet history: {message}")
+
+        self.data_service.submit(channel, BetDatabase.get_bets_page, cursor, self.PAGE_SIZE, self.filters,
+                                 self.order_by, self.descending, on_result=deliver, on_error=failed)
+
+    def _append_page(self, cursor: Optional[str], page: Dict[str, Any]) -> None:
+        self._requested.discard(-1)
+        self.loading_changed.emit(False)
+        self._next_cursor = page['next_cursor']
+        self._exhausted = page['next_cursor'] is None
+        rows = [self._format_bet(bet) for bet in page['bets']]
+        if not rows:
+            return
+        index = len(self._page_starts)
+        self.beginInsertRows(QModelIndex(), self._row_count, self._row_count + len(rows) - 1)
+        self._page_starts.append(cursor)
+        self._store_page(index, rows)
+        self._row_count += len(rows)
+        self.endInsertRows()
+
+    def _reload_page(self, index: int) -> None:
+        self._requested.add(index)
+        self._request(None, self._page_starts[index], lambda page: self._page_reloaded(index, page))
+
+    def _page_reloaded(self, index: int, page: Dict[str, Any]) -> None:
+        self._requested.discard(index)
+        self._store_page(index, [self._format_bet(bet) for bet in page['bets']])
+        first = index * self.PAGE_SIZE
+        last = min(first + self.PAGE_SIZE, self._row_count) - 1
+        self.dataChanged.emit(self.index(first, 0), self.index(last, len(self.HEADERS) - 1))
+
+    def _store_page(self, index: int, rows: List[tuple]) -> None:
+        self._pages[index] = rows
+        self._pages.move_to_end(index)
+        while len(self._pages) > self.CACHE_PAGES:
+            self._pages.popitem(last=False)
+
+    def _row(self, row: int, request: bool = True) -> Optional[tuple]:
+        index, offset = divmod(row, self.PAGE_SIZE)
+        rows = self._pages.get(index)
+        if rows is None:
+            if request and index not in self._requested and index < len(self._page_starts):
+                self._reload_page(index)
+            return None
+        self._pages.move_to_end(index)
+        return rows[offset] if offset < len(rows) else None
+
+    # --- Formatting ---
+    @staticmethod
+    def _format_bet(bet: Dict[str, Any]) -> tuple:
+        """(display texts, column -> color, bet) for one row, computed once per page load"""
+        result = bet.get('result') or ''
+        profit = BetDatabase.bet_profit(result, bet['stake'], bet['odds'], bet.get('cash_out_amount'))
+        match = f"{bet.get('team_a') or '—'} vs {bet.get('team_b') or '—'}"
+        bet_text = ': '.join(part for part in (bet.get('bet_type'), bet.get('bet_option')) if part)
+        texts = (
+            Formatters.format_date(bet.get('date')),
+            match,
+            bet.get('tournament') or '—',
+            bet_text or '—',
+            Formatters.format_odds(bet['odds']),
+            Formatters.format_currency(bet['stake']),
+            result or 'Pending',
+            Formatters.format_profit_loss(profit),
+        )
+        colors = {
+            BetHistoryModel.COLUMN_RESULT: Formatters.get_result_color(result),
+            BetHistoryModel.COLUMN_PROFIT: Formatters.get_profit_loss_color(profit),
+        }
+        details = {
+            'match': match,
+            'date': bet.get('date'),
+            'amount': bet['stake'],
+            'odds': bet['odds'],
+            'result': result or 'Pending',
+            'profit_loss': profit,
+            'tournament': bet.get('tournament'),
+            'location': bet.get('location'),
+            'bet_type': bet.get('bet_type'),
+            'bet_option': bet.get('bet_option'),
+        }
+        return texts, colors, details
@@ -0,0 +1,194 @@
+from PyQt5.QtWidgets import QTableView, QHeaderView, QAbstractItemView, QStyledItemDelegate
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QRect
+from PyQt5.QtGui import QColor, QCursor, QPainter
+from typing import Any, Dict, List, Optional
+from ..utils.formatters import Formatters
+
+
+class HoverRowDelegate(QStyledItemDelegate):
+    """Paints the hover background behind every cell of the table's hovered row"""
+
+    def __init__(self, table: 'BetTable') -> None:
+        super().__init__(table)
+        self.table = table
+        self.hover_color = QColor(BetTable.COLOR_ROW_HOVER)
+
+    def paint(self, painter: QPainter, option, index: QModelIndex) -> None:
+        if index.row() == self.table.hovered_row:
+            painter.fillRect(option.rect, self.hover_color)
+        super().paint(painter, option, index)
+
+
+class BetTable(QTableView):
+    """Read-only, styled bet table with whole-row hover highlighting
+
+    The hovered row is a single piece of state read by HoverRowDelegate;
+    when it changes only the previous and the new row are repainted, so
+    hover cost does not depend on the size of the table. Shows
+    placeholder text while the model is empty.
+    """
+
+    # Color constants
+    COLOR_TEXT = "#ffffff"
+    COLOR_BACKGROUND = "#2a2a2a"
+    COLOR_GRIDLINE = "#3a3a3a"
+    COLOR_HEADER = "#1e1e1e"
+    COLOR_ROW_HOVER = "#3a3a3a"
+    COLOR_GRAY = "#888888"
+
+    ROW_HEIGHT = 36
+
+    def __init__(self, parent=None, placeholder: str = "") -> None:
+        super().__init__(parent)
+        self.hovered_row = -1
+        self.placeholder = placeholder
+        self.setItemDelegate(HoverRowDelegate(self))
+        self.setStyleSheet(f"""
+            QTableView {{
+                background-color: {self.COLOR_BACKGROUND};
+                color: {self.COLOR_TEXT};
+                border: none;
+                border-radius: 10px;
+                gridline-color: {self.COLOR_GRIDLINE};
+            }}
+            QHeaderView::section {{
+                background-color: {self.COLOR_HEADER};
+                color: {self.COLOR_TEXT};
+                padding: 8px;
+                border: none;
+                font-weight: bold;
+            }}
+        """)
+        self.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.verticalHeader().setVisible(False)
+        # Fixed row heights keep the view from measuring rows it never shows
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.verticalHeader().setDefaultSectionSize(self.ROW_HEIGHT)
+        self.setMouseTracking(True)
+
+    def setModel(self, model: QAbstractTableModel) -> None:
+        super().setModel(model)
+        model.modelReset.connect(lambda: self.set_hovered_row(-1))
+
+    # --- Hover ---
+    def set_hovered_row(self, row: int) -> None:
+        if row == self.hovered_row:
+            return
+        previous, self.hovered_row = self.hovered_row, row
+        self._update_row(previous)
+        self._update_row(row)
+
+    def _update_row(self, row: int) -> None:
+        if row >= 0:
+            self.viewport().update(QRect(0, self.rowViewportPosition(row), self.viewport().width(), self.rowHeight(row)))
+
+    def mouseMoveEvent(self, event) -> None:
+        self.set_hovered_row(self.rowAt(event.pos().y()))
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event) -> None:
+        self.set_hovered_row(-1)
+        super().leaveEvent(event)
+
+    def scrollContentsBy(self, dx: int, dy: int) -> None:
+        super().scrollContentsBy(dx, dy)
+        # Scrolling moves a different row under a resting cursor
+        if dy and self.underMouse():
+            self.set_hovered_row(self.rowAt(self.viewport().mapFromGlobal(QCursor.pos()).y()))
+
+    def paintEvent(self, event) -> None:
+        super().paintEvent(event)
+        if self.placeholder and self.model() is not None and self.model().rowCount() == 0:
+            painter = QPainter(self.viewport())
+            painter.setPen(QColor(self.COLOR_GRAY))
+            painter.drawText(self.viewport().rect(), Qt.AlignCenter, self.placeholder)
+
+
+class BetListModel(QAbstractTableModel):
+    """Small in-memory list of bets for BetTable (e.g. recent activity)
+
+    Bets are dicts with keys match, date, amount, odds, result and
+    profit_loss, the same shape BetDetailsDialog shows.
+    """
+
+    COLUMNS = [
+        ('match', "Match"),
+        ('date', "Date"),
+        ('amount', "Amount"),
+        ('odds', "Odds"),
+        ('result', "Result"),
+        ('profit_loss', "Profit/Loss"),
+    ]
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._bets: List[Dict[str, Any]] = []
+
+    def set_bets(self, bets: List[Dict[str, Any]]) -> None:
+        self.beginResetModel()
+        self._bets = list(bets)
+        self.endResetModel()
+
+    def prepend_bet(self, bet: Dict[str, Any], limit: Optional[int] = None) -> None:
+        """Insert a bet as the first row, dropping the last rows beyond limit"""
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._bets.insert(0, bet)
+        self.endInsertRows()
+        if limit is not None and len(self._bets) > limit:
+            self.beginRemoveRows(QModelIndex(), limit, len(self._bets) - 1)
+            del self._bets[limit:]
+            self.endRemoveRows()
+
+    def bet(self, row: int) -> Optional[Dict[str, Any]]:
+        return self._bets[row] if 0 <= row < len(self._bets) else None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._bets)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole) -> Any:
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section][1]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        bet = self._bets[index.row()]
+        key = self.COLUMNS[index.column()][0]
+        if role == Qt.DisplayRole:
+            return self._format(key, bet)
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter)
+        if role == Qt.ForegroundRole:
+            if key == 'result':
+                return QColor(Formatters.get_result_color(bet.get('result')))
+            if key == 'profit_loss':
+                return QColor(Formatters.get_profit_loss_color(bet.get('profit_loss', 0)))
+        return None
+
+    @staticmethod
+    def _format(key: str, bet: Dict[str, Any]) -> str:
+        if key == 'date':
+            return Formatters.format_date(bet.get('date'))
+        if key == 'amount':
+            return Formatters.format_currency(bet.get('amount', 0))
+        if key == 'odds':
+            return Formatters.format_odds(bet.get('odds'))
+        if key == 'profit_loss':
+            return Formatters.format_profit_loss(bet.get('profit_loss', 0))
+        return str(bet.get(key) or '—')
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.AscendingOrder) -> None:
+        if not 0 <= column < len(self.COLUMNS):
+            return
+        key = self.COLUMNS[column][0]
+        self.layoutAboutToBeChanged.emit()
+        self._bets.sort(key=lambda bet: (bet.get(key) is None, bet.get(key) if bet.get(key) is not None else 0),
+                        reverse=order == Qt.DescendingOrder)
+        self.layoutChanged.emit()
@@ -0,0 +1,58 @@
+from PyQt5.QtWidgets import QCompleter
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QVariant
+from typing import List, Optional
+from ..utils.prefix_index import PrefixIndex
+
+
+class PrefixCompleterModel(QAbstractListModel):
+    """List model holding the current top-k matches of a PrefixIndex"""
+
+    def __init__(self, parent=None, max_results: int = 15) -> None:
+        super().__init__(parent)
+        self.index = PrefixIndex()
+        self.max_results = max_results
+        self._matches: List[str] = []
+
+    def set_index(self, index: PrefixIndex) -> None:
+        self.index = index
+        self.update_matches('')
+
+    def update_matches(self, prefix: str) -> None:
+        matches = self.index.search(prefix, self.max_results)
+        if matches == self._matches:
+            return
+        self.beginResetModel()
+        self._matches = matches
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._matches)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if index.isValid() and role in (Qt.DisplayRole, Qt.EditRole):
+            return self._matches[index.row()]
+        return QVariant()
+
+
+class PrefixCompleter(QCompleter):
+    """QCompleter backed by a PrefixIndex instead of filtering a full item model
+
+    Qt asks for the completion path on every keystroke; the model is
+    refilled with the ranked matches for it and an empty path is handed
+    back so Qt shows those rows as they are.
+    """
+
+    def __init__(self, parent=None, max_results: int = 15) -> None:
+        super().__init__(parent)
+        self.completer_model = PrefixCompleterModel(self, max_results)
+        self.setModel(self.completer_model)
+        self.setCaseSensitivity(Qt.CaseInsensitive)
+        self.setCompletionMode(QCompleter.PopupCompletion)
+        self.setMaxVisibleItems(max_results)
+
+    def set_index(self, index: Optional[PrefixIndex]) -> None:
+        self.completer_model.set_index(index or PrefixIndex())
+
+    def splitPath(self, path: str) -> List[str]:
+        self.completer_model.update_matches(path)
+        return ['']
@@ -47,13 +47,17 @@ class SummaryCard(QFrame):
         """
         if highlight:
             # If we have specific parts to highlight
+            # Mark the parts first so a later value (e.g. 0) can't match inside an earlier span
+            colors = {'green': '#4CAF50', 'red': '#F44336'}
             current_text = str(value)
+            spans = {}
             for color, val in highlight.items():
-                if color == 'green':
-                    colored_text = current_text.replace(str(val), f'<span style="color: #4CAF50;">{val}</span>')
-                elif color == 'red':
-                    colored_text = current_text.replace(str(val), f'<span style="color: #F44336;">{val}</span>')
-                current_text = colored_text
+                if color in colors:
+                    marker = f"\x00{chr(ord('a') + len(spans))}\x00"
+                    spans[marker] = f'<span style="color: {colors[color]};">{val}</span>'
+                    current_text = current_text.replace(str(val), marker)
+            for marker, span in spans.items():
+                current_text = current_text.replace(marker, span)
             self.value_label.setText(current_text)
             self.value_label.setTextFormat(Qt.RichText)
         else:
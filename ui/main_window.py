@@ -1,14 +1,40 @@
 from PyQt5.QtWidgets import QMainWindow, QLabel, QPushButton, QWidget, QHBoxLayout, QVBoxLayout, QStackedWidget
-from PyQt5.QtCore import Qt
-from .pages import HomePage, NewBetPage, BalancePage, StatisticsPage, SettingsPage, HistoryPage
+from PyQt5.QtCore import Qt, QTimer
+from typing import Dict, Optional
+import time
+from . import pages
+from .services.data_service import DataService
+from .services.dashboard_model import DashboardModel
+from database.bet_database import BetDatabase
 
 class MainWindow(QMainWindow):
-    def __init__(self):
+    # Page name -> (attribute holding the page, class name in ui.pages).
+    # Pages are built on first navigation; only the home page exists at startup.
+    PAGES = {
+        'home': ('home_page', 'HomePage'),
+        'new_bet': ('new_bet_page', 'NewBetPage'),
+        'balance': ('balance_page', 'BalancePage'),
+        'stats': ('stats_page', 'StatisticsPage'),
+        'settings': ('settings_page', 'SettingsPage'),
+        'history': ('history_page', 'HistoryPage'),
+    }
+
+    def __init__(self, started_at: Optional[float] = None):
+        """started_at: time.perf_counter() at process start, for the time-to-first-window metric"""
         super().__init__()
+        self.started_at = started_at if started_at is not None else time.perf_counter()
+        # Startup metrics in milliseconds since started_at, plus page build times
+        self.startup_metrics: Dict[str, float] = {}
+        self.page_build_ms: Dict[str, float] = {}
+        self._first_show = True
+        # Shared by every page: one database connection, worker and cache
+        self.data = DataService(parent=self)
+        self.dashboard = DashboardModel(self.data, self)
         self.setWindowTitle("Sport Betting Tracker")
         self.resize(1300, 800)  # Set initial size
         self.setFixedSize(self.size())  # Lock the window to this size
         self.init_ui()
+        self.mark_startup('window_built')
 
     def init_ui(self):
         # Create main widget and layout
@@ -73,21 +99,8 @@ class MainWindow(QMainWindow):
 
         # Create stacked widget for content
         self.stacked_widget = QStackedWidget()
-        
-        # Create and add pages
-        self.home_page = HomePage()
-        self.new_bet_page = NewBetPage()
-        self.balance_page = BalancePage()
-        self.stats_page = StatisticsPage()
-        self.settings_page = SettingsPage()
-        self.history_page = HistoryPage()
-
-        self.stacked_widget.addWidget(self.home_page)
-        self.stacked_widget.addWidget(self.new_bet_page)
-        self.stacked_widget.addWidget(self.balance_page)
-        self.stacked_widget.addWidget(self.stats_page)
-        self.stacked_widget.addWidget(self.settings_page)
-        self.stacked_widget.addWidget(self.history_page)
+        for attribute, _ in self.PAGES.values():
+            setattr(self, attribute, None)
 
         # Add widgets to main layout
         main_layout.addWidget(header_widget)
@@ -97,42 +110,79 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(main_widget)
 
         # Connect buttons to page switching
-        self.btn_home.clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.home_page))
-        self.btn_new_bet.clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.new_bet_page))
-        self.btn_balance.clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.balance_page))
-        self.btn_stats.clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.stats_page))
-        self.btn_settings.clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.settings_page))
-        self.btn_history.clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.history_page))
-
-        # Connect home page signals
-        self.home_page.new_bet_clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.new_bet_page))
-        self.home_page.statistics_clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.stats_page))
-        self.home_page.balance_clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.balance_page))
-        self.home_page.history_clicked.connect(lambda: self.stacked_widget.setCurrentWidget(self.history_page))
+        self.btn_home.clicked.connect(lambda: self.show_page('home'))
+        self.btn_new_bet.clicked.connect(lambda: self.show_page('new_bet'))
+        self.btn_balance.clicked.connect(lambda: self.show_page('balance'))
+        self.btn_stats.clicked.connect(lambda: self.show_page('stats'))
+        self.btn_settings.clicked.connect(lambda: self.show_page('settings'))
+        self.btn_history.clicked.connect(lambda: self.show_page('history'))
 
         # Set initial page
-        self.stacked_widget.setCurrentWidget(self.home_page)
-        
-        # Update stats for the home page
-        self.home_page.update_stats(
-            total_bets=10,
-            wins=7,
-            losses=3,
-            profit_loss=150.50,
-            active_bets=2
-        )
-        
-        # Update recent bets for the home page
-        recent_bets = [
-            {
-                'match': 'Team A vs Team B',
-                'date': '2024-04-17',
-                'amount': 100.00,
-                'odds': 2.5,
-                'result': 'Won',
-                'profit_loss': 150.00
-            },
-            # ... more bets ...
-        ]
-        self.home_page.update_recent_bets(recent_bets)
-        
\ No newline at end of file
+        self.show_page('home')
+
+    def get_page(self, name: str) -> QWidget:
+        """Return a page, building it and adding it to the stack on first use"""
+        attribute, class_name = self.PAGES[name]
+        page = getattr(self, attribute)
+        if page is None:
+            start = time.perf_counter()
+            page = getattr(pages, class_name)(self.data)
+            setattr(self, attribute, page)
+            self.stacked_widget.addWidget(page)
+            self.setup_page(name, page)
+            self.page_build_ms[name] = (time.perf_counter() - start) * 1000
+        return page
+
+    def show_page(self, name: str) -> None:
+        self.stacked_widget.setCurrentWidget(self.get_page(name))
+
+    def setup_page(self, name: str, page: QWidget) -> None:
+        """Connect a freshly built page to the rest of the window"""
+        if name == 'home':
+            page.new_bet_clicked.connect(lambda: self.show_page('new_bet'))
+            page.statistics_clicked.connect(lambda: self.show_page('stats'))
+            page.balance_clicked.connect(lambda: self.show_page('balance'))
+            page.history_clicked.connect(lambda: self.show_page('history'))
+
+            # Cards and recent activity follow the dashboard model
+            self.dashboard.loaded.connect(lambda: self._show_dashboard(page))
+            self.dashboard.bet_applied.connect(lambda entry: self._show_new_bet(page, entry))
+            if self.dashboard.is_loaded:
+                self._show_dashboard(page)
+        elif name == 'new_bet':
+            page.bet_added.connect(self.dashboard.apply_bet)
+
+    def _show_dashboard(self, page: QWidget) -> None:
+        page.update_stats(**self.dashboard.stats())
+        page.update_recent_bets(self.dashboard.recent_bets())
+
+    def _show_new_bet(self, page: QWidget, entry: dict) -> None:
+        page.update_stats(**self.dashboard.stats())
+        page.add_recent_bet(entry, DashboardModel.RECENT_BETS)
+
+    # --- Startup ---
+    def mark_startup(self, event: str) -> None:
+        """Record milliseconds from process start to a startup event"""
+        self.startup_metrics[event] = (time.perf_counter() - self.started_at) * 1000
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._first_show:
+            self._first_show = False
+            # Runs once the event loop has painted the window
+            QTimer.singleShot(0, self._on_first_window)
+
+    def _on_first_window(self) -> None:
+        self.mark_startup('first_window')
+        print(f"Startup: first window in {self.startup_metrics['first_window']:.0f} ms "
+              f"(window built at {self.startup_metrics['window_built']:.0f} ms)")
+        # Opening the shared database (and any pending schema migrations) runs
+        # off the critical path; see BetDatabase.ensure_schema
+        self.data.submit(None, BetDatabase.get_schema_version,
+                         on_result=lambda _: self.mark_startup('database_ready'))
+        self.dashboard.load()
+        self.data.load_catalog()
+
+    def closeEvent(self, event):
+        self.data.close()
+        super().closeEvent(event)
@@ -1,8 +1,20 @@
-from .home_page import HomePage
-from .new_bet_page import NewBetPage
-from .balance_page import BalancePage
-from .statistics_page import StatisticsPage
-from .settings_page import SettingsPage
-from .history_page import HistoryPage
-
-__all__ = ['HomePage', 'NewBetPage', 'BalancePage', 'StatisticsPage', 'SettingsPage', 'HistoryPage'] 
\ No newline at end of file
+import importlib
+
+# Page modules are imported on first access (PEP 562) so startup only pays
+# for the pages MainWindow actually builds
+_PAGE_MODULES = {
+    'HomePage': '.home_page',
+    'NewBetPage': '.new_bet_page',
+    'BalancePage': '.balance_page',
+    'StatisticsPage': '.statistics_page',
+    'SettingsPage': '.settings_page',
+    'HistoryPage': '.history_page',
+}
+
+__all__ = ['HomePage', 'NewBetPage', 'BalancePage', 'StatisticsPage', 'SettingsPage', 'HistoryPage']
+
+
+def __getattr__(name):
+    if name in _PAGE_MODULES:
+        return getattr(importlib.import_module(_PAGE_MODULES[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,10 @@
 from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout
+from ui.services.data_service import DataService
 
 class BalancePage(QWidget):
-    def __init__(self):
+    def __init__(self, data: DataService):
         super().__init__()
+        self.data = data
         layout = QVBoxLayout()
         label = QLabel("Balance Page")
         label.setStyleSheet("font-size: 24px;")
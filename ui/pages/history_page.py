@@ -1,10 +1,140 @@
-from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout
+from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QComboBox
+from PyQt5.QtCore import Qt, QModelIndex
+from PyQt5.QtGui import QFont
+from typing import Any
+from ..components.bet_history_model import BetHistoryModel
+from ..components.bet_table import BetTable
+from ..dialogs.bet_details_dialog import BetDetailsDialog
+from ui.services.data_service import DataService
+from ui.services.catalog_snapshot import CatalogSnapshot
+from database.bet_database import BetDatabase
 
 class HistoryPage(QWidget):
-    def __init__(self):
+    # Color constants
+    COLOR_TEXT = "#ffffff"
+    COLOR_INPUT = "#3a3a3a"
+
+    ALL_ITEMS = "All"
+    RESULTS = [BetDatabase.RESULT_WIN, BetDatabase.RESULT_LOSE, BetDatabase.RESULT_CASHED_OUT]
+
+    def __init__(self, data: DataService):
         super().__init__()
-        layout = QVBoxLayout()
-        label = QLabel("Bet History Page")
-        label.setStyleSheet("font-size: 24px;")
-        layout.addWidget(label)
-        self.setLayout(layout) 
\ No newline at end of file
+        self.data = data
+        self.sport_game_ids = {}
+        main_layout = QVBoxLayout()
+        main_layout.setSpacing(15)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+
+        title_label = QLabel("Bet History")
+        title_font = QFont()
+        title_font.setPointSize(32)
+        title_font.setBold(True)
+        title_label.setFont(title_font)
+        title_label.setStyleSheet("color: white;")
+        main_layout.addWidget(title_label)
+
+        # Filters (applied in SQL by the model)
+        filters_layout = QHBoxLayout()
+        self.sport_game_combo = self.create_filter_combo()
+        self.result_combo = self.create_filter_combo()
+        self.result_combo.addItems(self.RESULTS)
+        for text, combo in (("Sport/Game:", self.sport_game_combo), ("Result:", self.result_combo)):
+            label = QLabel(text)
+            label.setStyleSheet(f"color: {self.COLOR_TEXT}; font-size: 14px;")
+            filters_layout.addWidget(label)
+            filters_layout.addWidget(combo)
+        filters_layout.addStretch()
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("color: #888888;")
+        filters_layout.addWidget(self.status_label)
+        main_layout.addLayout(filters_layout)
+
+        self.model = BetHistoryModel(self.data, self)
+        self.model.loading_changed.connect(self.update_status)
+        self.model.rowsInserted.connect(lambda *args: self.update_status())
+        self.model.modelReset.connect(self.update_status)
+
+        self.table = BetTable(placeholder="No bets found")
+        self.table.setModel(self.model)
+        self.table.doubleClicked.connect(self.handle_bet_details)
+
+        # Only columns the database can order are sortable; see handle_sort_changed
+        header = self.table.horizontalHeader()
+        header.setSectionsClickable(True)
+        header.setSortIndicatorShown(True)
+        header.setSortIndicator(0, Qt.DescendingOrder)
+        header.sortIndicatorChanged.connect(self.handle_sort_changed)
+        main_layout.addWidget(self.table)
+
+        self.setLayout(main_layout)
+
+        self.sport_game_combo.currentIndexChanged.connect(self.apply_filters)
+        self.result_combo.currentIndexChanged.connect(self.apply_filters)
+        self.data.changed.connect(self.handle_data_changed)
+        self.data.catalog_changed.connect(self.load_sport_games)
+        if self.data.catalog is not None:
+            self.load_sport_games(self.data.catalog)
+        else:
+            self.data.load_catalog()
+        self.model.reload()
+
+    def create_filter_combo(self) -> QComboBox:
+        """Helper method to create a filter dropdown starting with the 'All' entry"""
+        combo = QComboBox()
+        combo.addItem(self.ALL_ITEMS)
+        combo.setMinimumWidth(180)
+        combo.setStyleSheet(f"""
+            QComboBox {{
+                background-color: {self.COLOR_INPUT};
+                color: {self.COLOR_TEXT};
+                border: none;
+                padding: 6px;
+                border-radius: 5px;
+            }}
+        """)
+        return combo
+
+    def load_sport_games(self, catalog: CatalogSnapshot) -> None:
+        if catalog.sport_game_ids == self.sport_game_ids:
+            return
+        current = self.sport_game_combo.currentText()
+        self.sport_game_ids = dict(catalog.sport_game_ids)
+        self.sport_game_combo.blockSignals(True)
+        self.sport_game_combo.clear()
+        self.sport_game_combo.addItem(self.ALL_ITEMS)
+        self.sport_game_combo.addItems(sorted(self.sport_game_ids))
+        self.sport_game_combo.setCurrentText(current)
+        self.sport_game_combo.blockSignals(False)
+
+    def apply_filters(self) -> None:
+        result = self.result_combo.currentText()
+        self.model.set_filters({
+            'sport_game_id': self.sport_game_ids.get(self.sport_game_combo.currentText()),
+            'result': result if result != self.ALL_ITEMS else None,
+        })
+
+    def handle_sort_changed(self, column: int, order: Qt.SortOrder) -> None:
+        if column in BetHistoryModel.SORT_ORDERS:
+            self.model.sort(column, order)
+            return
+        # Put the indicator back on the column the rows are actually ordered by
+        header = self.table.horizontalHeader()
+        current = next(col for col, key in BetHistoryModel.SORT_ORDERS.items() if key == self.model.order_by)
+        header.blockSignals(True)
+        header.setSortIndicator(current, Qt.DescendingOrder if self.model.descending else Qt.AscendingOrder)
+        header.blockSignals(False)
+
+    def handle_data_changed(self, topic: str, payload: Any) -> None:
+        if topic == DataService.BETS:
+            self.model.reload()
+
+    def handle_bet_details(self, index: QModelIndex) -> None:
+        bet = self.model.bet(index.row())
+        if bet:
+            BetDetailsDialog(bet, self).exec_()
+
+    def update_status(self, loading: bool = False) -> None:
+        rows = self.model.rowCount()
+        more = "+" if self.model.canFetchMore() else ""
+        self.table.placeholder = "Loading..." if loading else "No bets found"
+        self.status_label.setText("Loading..." if loading else f"{rows}{more} bets")
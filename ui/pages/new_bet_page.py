@@ -2,13 +2,16 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QFormLayout, QHBoxLayout,
                             QLabel, QLineEdit, QComboBox, QRadioButton,
                             QButtonGroup, QTextEdit, QPushButton, QDoubleSpinBox,
                             QFrame, QMessageBox, QInputDialog)
-from PyQt5.QtCore import Qt, pyqtSignal, QLocale
+from PyQt5.QtCore import Qt, pyqtSignal, QLocale, QTimer
 from PyQt5.QtGui import QFont, QColor
 from typing import Dict, Any, Optional, List
 from ui.utils.formatters import Formatters
+from ui.services.data_service import DataService
+from ui.services.catalog_snapshot import CatalogSnapshot
+from ui.utils.prefix_index import PrefixIndex
+from ui.components.prefix_completer import PrefixCompleter
 from dataclasses import dataclass
 from datetime import datetime
-from database.bet_database import BetDatabase
 
 @dataclass
 class BetDataModel:
@@ -40,12 +43,29 @@ class NewBetPage(QWidget):
     COLOR_BORDER = "#4a4a4a"
     COLOR_ERROR = "#F44336"
     COLOR_SUCCESS = "#4CAF50"
+
+    # Most used entries listed in the team/tournament/location dropdowns;
+    # the rest are reached by typing (see PrefixCompleter)
+    DROPDOWN_ITEMS = 25
+    # Dimension table behind each autocompleted field
+    AUTOCOMPLETE_TABLES = CatalogSnapshot.USAGE_TABLES
     
-    def __init__(self) -> None:
+    def __init__(self, data: DataService) -> None:
         super().__init__()
-        self.db = BetDatabase()
+        self.data = data
         self.selected_category = "Sport"
         self.selected_sport_game_id = None
+        self.catalog: Optional[CatalogSnapshot] = None
+        self.sport_game_ids: Dict[str, int] = {}
+        self.prefix_indexes: Dict[str, PrefixIndex] = {}
+        # Field changes only mark the preview dirty; it is rebuilt once per
+        # event-loop turn however many signals fired (see schedule_preview_update)
+        self.preview_timer = QTimer(self)
+        self.preview_timer.setSingleShot(True)
+        self.preview_timer.setInterval(0)
+        self.preview_timer.timeout.connect(self.validate_and_update_preview)
+        self.preview_requests = 0
+        self.preview_updates = 0
         self.bet_data = BetDataModel(
             category="Sport",
             sport_game="",
@@ -62,29 +82,53 @@ class NewBetPage(QWidget):
             result=""
         )
         self.setup_ui()
+        self.setup_completers()
         self.setup_connections()
-        self.load_categories()
+        # Every dropdown is filled from the shared in-memory catalog
+        self.data.catalog_changed.connect(self.set_catalog)
+        if self.data.catalog is not None:
+            self.set_catalog(self.data.catalog)
+        else:
+            self.data.load_catalog()
         
     def setup_connections(self) -> None:
         """Setup signal connections for validation and preview"""
         self.category_combo.currentTextChanged.connect(self.load_sport_games)
         self.sport_game_combo.currentTextChanged.connect(self.on_sport_game_changed)
-        self.tournament_combo.editTextChanged.connect(self.validate_and_update_preview)
-        self.team_a_combo.editTextChanged.connect(self.validate_and_update_preview)
-        self.team_b_combo.editTextChanged.connect(self.validate_and_update_preview)
-        self.location_combo.editTextChanged.connect(self.validate_and_update_preview)
-        self.bet_type_combo.currentTextChanged.connect(self.validate_and_update_preview)
+        self.tournament_combo.editTextChanged.connect(self.schedule_preview_update)
+        self.team_a_combo.editTextChanged.connect(self.schedule_preview_update)
+        self.team_b_combo.editTextChanged.connect(self.schedule_preview_update)
+        self.location_combo.editTextChanged.connect(self.schedule_preview_update)
+        self.bet_type_combo.currentTextChanged.connect(self.schedule_preview_update)
         self.bet_type_combo.currentTextChanged.connect(self.update_bet_details)
-        self.bet_input.textChanged.connect(self.validate_and_update_preview)
-        self.bet_combo.currentTextChanged.connect(self.validate_and_update_preview)
-        self.line_input.valueChanged.connect(self.validate_and_update_preview)
-        self.live_radio.toggled.connect(self.validate_and_update_preview)
-        self.prematch_radio.toggled.connect(self.validate_and_update_preview)
-        self.odds_input.valueChanged.connect(self.validate_and_update_preview)
-        self.stake_input.valueChanged.connect(self.validate_and_update_preview)
-        self.result_combo.currentTextChanged.connect(self.validate_and_update_preview)
+        self.bet_input.textChanged.connect(self.schedule_preview_update)
+        self.bet_combo.currentTextChanged.connect(self.schedule_preview_update)
+        self.line_input.valueChanged.connect(self.schedule_preview_update)
+        self.live_radio.toggled.connect(self.schedule_preview_update)
+        self.prematch_radio.toggled.connect(self.schedule_preview_update)
+        self.odds_input.valueChanged.connect(self.schedule_preview_update)
+        self.stake_input.valueChanged.connect(self.schedule_preview_update)
+        self.result_combo.currentTextChanged.connect(self.schedule_preview_update)
         self.result_combo.currentTextChanged.connect(self.toggle_cash_out_amount)
-        self.cash_out_amount.valueChanged.connect(self.validate_and_update_preview)
+        self.cash_out_amount.valueChanged.connect(self.schedule_preview_update)
+        self.team_a_combo.activated.connect(lambda idx: self.handle_add_new_option(self.team_a_combo, 'team'))
+        self.team_b_combo.activated.connect(lambda idx: self.handle_add_new_option(self.team_b_combo, 'team'))
+        self.tournament_combo.activated.connect(lambda idx: self.handle_add_new_option(self.tournament_combo, 'tournament'))
+        self.location_combo.activated.connect(lambda idx: self.handle_add_new_option(self.location_combo, 'location'))
+
+    def setup_completers(self) -> None:
+        """Attach prefix-index completers to the editable dropdowns"""
+        self.completers: Dict[str, PrefixCompleter] = {}
+        combos = {
+            'team_a': self.team_a_combo,
+            'team_b': self.team_b_combo,
+            'tournament': self.tournament_combo,
+            'location': self.location_combo,
+        }
+        for key, combo in combos.items():
+            completer = PrefixCompleter(combo)
+            combo.setCompleter(completer)
+            self.completers[key] = completer
 
     def setup_ui(self) -> None:
         """Setup the UI components"""
@@ -478,19 +522,31 @@ class NewBetPage(QWidget):
         
         self.setStyleSheet(input_style)
         
+    def set_catalog(self, catalog: CatalogSnapshot) -> None:
+        """Show a new catalog snapshot (DataService.catalog_changed)"""
+        previous, self.catalog = self.catalog, catalog
+        if previous is None or previous.sport_games != catalog.sport_games:
+            self.load_categories()
+        else:
+            # Only team/tournament/location names or usage changed
+            self.load_dropdown_data()
+
     def load_categories(self):
+        if self.catalog is None:
+            return
         self.category_combo.clear()
-        categories = set([cat for _, _, cat in self.db.get_all_sport_games()])
-        for cat in sorted(categories):
+        for cat in self.catalog.categories:
             self.category_combo.addItem(cat)
         self.category_combo.setEnabled(True)
         self.category_combo.setCurrentText("Sport")
         self.load_sport_games()
 
     def load_sport_games(self):
-        category = self.category_combo.currentText()
+        if self.catalog is None:
+            return
+        sport_games = self.catalog.sport_games_in(self.category_combo.currentText())
+        self.sport_game_ids = {name: sg_id for sg_id, name, _ in sport_games}
         self.sport_game_combo.clear()
-        sport_games = self.db.get_all_sport_games(category)
         for sg_id, name, _ in sport_games:
             self.sport_game_combo.addItem(name)
         if sport_games:
@@ -502,58 +558,39 @@ class NewBetPage(QWidget):
         self.update_bet_types()
 
     def on_sport_game_changed(self):
-        # Update selected_sport_game_id
-        category = self.category_combo.currentText()
+        # Update selected_sport_game_id from the ids loaded with the combo
         sport_game_name = self.sport_game_combo.currentText()
-        sport_games = self.db.get_all_sport_games(category)
-        for sg_id, name, _ in sport_games:
-            if name == sport_game_name:
-                self.selected_sport_game_id = sg_id
-                break
-        else:
-            self.selected_sport_game_id = None
+        self.selected_sport_game_id = self.sport_game_ids.get(sport_game_name)
         self.load_dropdown_data()
         self.update_bet_types()
 
     def load_dropdown_data(self) -> None:
         sport_game_id = self.selected_sport_game_id
-        if not sport_game_id:
+        if self.catalog is None or not sport_game_id:
             return
-        self.team_a_combo.clear()
-        self.team_b_combo.clear()
-        self.tournament_combo.clear()
-        self.location_combo.clear()
-        # Load teams
-        teams = self.db.get_teams_for_sport_game(sport_game_id)
-        for _, name in teams:
-            self.team_a_combo.addItem(name)
-            self.team_b_combo.addItem(name)
-        self.team_a_combo.addItem("Add new team...")
-        self.team_b_combo.addItem("Add new team...")
-        self.team_a_combo.activated.connect(lambda idx: self.handle_add_new_option(self.team_a_combo, 'team'))
-        self.team_b_combo.activated.connect(lambda idx: self.handle_add_new_option(self.team_b_combo, 'team'))
-        # Load tournaments
-        tournaments = self.db.get_tournaments_for_sport_game(sport_game_id)
-        for _, name in tournaments:
-            self.tournament_combo.addItem(name)
-        self.tournament_combo.addItem("Add new tournament...")
-        self.tournament_combo.activated.connect(lambda idx: self.handle_add_new_option(self.tournament_combo, 'tournament'))
-        # Load locations
-        locations = self.db.get_locations_for_sport_game(sport_game_id)
-        for _, name in locations:
-            self.location_combo.addItem(name)
-        self.location_combo.addItem("Add new location...")
-        self.location_combo.activated.connect(lambda idx: self.handle_add_new_option(self.location_combo, 'location'))
+        self.prefix_indexes = self.catalog.indexes(sport_game_id)
+        # Both team fields share one index; only the most used entries go in the lists
+        fields = (
+            (self.team_a_combo, 'team_a', 'team'),
+            (self.team_b_combo, 'team_b', 'team'),
+            (self.tournament_combo, 'tournament', 'tournament'),
+            (self.location_combo, 'location', 'location'),
+        )
+        for combo, completer_key, index_key in fields:
+            index = self.prefix_indexes[index_key]
+            self.completers[completer_key].set_index(index)
+            combo.clear()
+            combo.addItems(index.top(self.DROPDOWN_ITEMS))
+            combo.addItem(f"Add new {index_key}...")
 
     def update_bet_types(self) -> None:
-        sport_game_id = self.selected_sport_game_id
         self.bet_type_combo.clear()
-        if not sport_game_id:
+        sport_game_id = self.selected_sport_game_id
+        if self.catalog is None or not sport_game_id:
             return
-        bet_types = self.db.get_bet_types_for_sport_game(sport_game_id)
-        for _, name, description in bet_types:
-            self.bet_type_combo.addItem(name)
-            self.bet_type_combo.setItemData(self.bet_type_combo.count() - 1, description, Qt.ToolTipRole)
+        for bet_type in self.catalog.bet_types(sport_game_id):
+            self.bet_type_combo.addItem(bet_type.name)
+            self.bet_type_combo.setItemData(self.bet_type_combo.count() - 1, bet_type.description, Qt.ToolTipRole)
 
     def handle_add_new_option(self, combo: QComboBox, option_type: str):
         text_map = {
@@ -564,55 +601,34 @@ class NewBetPage(QWidget):
         if combo.currentText().startswith("Add new"):
             text, ok = QInputDialog.getText(self, "Add New", text_map[option_type])
             if ok and text.strip():
-                sport_game_id = self.selected_sport_game_id
-                if option_type == 'team':
-                    self.db.add_team(text.strip(), sport_game_id)
-                    self.load_dropdown_data()
-                    combo.setCurrentText(text.strip())
-                elif option_type == 'tournament':
-                    self.db.add_tournament(text.strip(), sport_game_id)
-                    self.load_dropdown_data()
-                    self.tournament_combo.setCurrentText(text.strip())
-                elif option_type == 'location':
-                    self.db.add_location(text.strip(), sport_game_id)
-                    self.load_dropdown_data()
-                    self.location_combo.setCurrentText(text.strip())
+                name = text.strip()
+                # The dropdowns are refilled from the new snapshot before on_result runs
+                self.data.add_catalog_item(
+                    self.AUTOCOMPLETE_TABLES[option_type], name, self.selected_sport_game_id,
+                    on_result=lambda _: combo.setCurrentText(name)
+                )
 
     def update_bet_details(self) -> None:
-        sport_game_id = self.selected_sport_game_id
-        bet_type_name = self.bet_type_combo.currentText()
-        bet_type_id = self.db.get_bet_type_id(bet_type_name, sport_game_id) if sport_game_id else None
+        bet_type = None
+        if self.catalog is not None and self.selected_sport_game_id:
+            bet_type = self.catalog.bet_type(self.selected_sport_game_id, self.bet_type_combo.currentText())
         self.bet_input.setVisible(False)
         self.bet_combo.setVisible(False)
-        options = self.db.get_bet_type_options(bet_type_id) if bet_type_id else []
         # Disconnect previous signal to avoid multiple connections
         try:
             self.bet_combo.currentTextChanged.disconnect(self.update_line_visibility)
         except Exception:
             pass
-        if options:
-            option_type = options[0][1]
-            if option_type == 'dropdown':
-                self.bet_combo.setVisible(True)
-                self.bet_combo.clear()
-                import json
-                all_opts = []
-                for opt in options:
-                    if opt[2]:
-                        try:
-                            all_opts.extend(json.loads(opt[2]))
-                        except Exception:
-                            pass
-                all_opts = list(dict.fromkeys(all_opts))
-                for opt in all_opts:
-                    self.bet_combo.addItem(opt)
-                # Connect signal for dynamic line visibility
-                self.bet_combo.currentTextChanged.connect(self.update_line_visibility)
-            elif option_type == 'text':
-                self.bet_input.setVisible(True)
-                placeholder = options[0][3] if options[0][3] else "Enter bet option"
-                self.bet_input.setPlaceholderText(placeholder)
-        else:
+        if bet_type is not None and bet_type.option_type == 'dropdown':
+            self.bet_combo.setVisible(True)
+            self.bet_combo.clear()
+            self.bet_combo.addItems(bet_type.options)
+            # Connect signal for dynamic line visibility
+            self.bet_combo.currentTextChanged.connect(self.update_line_visibility)
+        elif bet_type is not None and bet_type.option_type == 'text':
+            self.bet_input.setVisible(True)
+            self.bet_input.setPlaceholderText(bet_type.placeholder or "Enter bet option")
+        elif bet_type is None or bet_type.option_type is None:
             self.bet_input.setVisible(True)
             self.bet_input.setPlaceholderText("Enter bet option")
         # Update line visibility after setting up bet option widgets
@@ -669,9 +685,17 @@ class NewBetPage(QWidget):
             'cash_out_amount': self.cash_out_amount.value() if self.result_combo.currentText() == "Cashed Out" else None
         }
         
-        # Save to database
-        bet_id = self.db.add_bet(bet_data)
-        
+        # Save to database in the background; the form stays responsive
+        self.add_button.setEnabled(False)
+        self.data.add_bet(
+            bet_data,
+            on_result=lambda bet_id: self._handle_bet_saved(bet_id, bet_data),
+            on_error=lambda message: self._handle_bet_saved(-1, bet_data)
+        )
+
+    def _handle_bet_saved(self, bet_id: int, bet_data: Dict[str, Any]) -> None:
+        """Report the outcome of a background add_bet"""
+        self.add_button.setEnabled(True)
         if bet_id == -1:
             QMessageBox.critical(
                 self,
@@ -690,10 +714,8 @@ class NewBetPage(QWidget):
         # Emit signal with bet data
         self.bet_added.emit(bet_data)
         
-        # Reset form
+        # Reset form; the dropdowns pick up new entries through set_catalog
         self.reset_form()
-        # Reload dropdown data to include new entries
-        self.load_dropdown_data()
 
     def handle_cancel(self) -> None:
         """Handle the cancel button click"""
@@ -758,8 +780,26 @@ class NewBetPage(QWidget):
         self.line_label.setVisible(False)
         self.line_input.setVisible(False)
 
+    def schedule_preview_update(self, *args) -> None:
+        """Mark the preview dirty; it is rebuilt when control returns to the event loop
+
+        Loading a sport/game or resetting the form changes a dozen fields in
+        one go, each emitting its own change signal; coalescing them turns
+        those into a single rebuild.
+        """
+        self.preview_requests += 1
+        if not self.preview_timer.isActive():
+            self.preview_timer.start()
+
+    @property
+    def preview_updates_saved(self) -> int:
+        """Preview rebuilds skipped because they were coalesced into a later one"""
+        return self.preview_requests - self.preview_updates - self.preview_timer.isActive()
+
     def validate_and_update_preview(self) -> None:
         """Validate inputs and update preview"""
+        self.preview_timer.stop()
+        self.preview_updates += 1
         # Get current values
         category = self.category_combo.currentText()
         sport_game = self.sport_game_combo.currentText()
@@ -816,8 +856,3 @@ class NewBetPage(QWidget):
         
         # Update preview
         self.preview_content.setText("\n".join(preview_text))
-
-    def __del__(self):
-        """Cleanup when the page is destroyed"""
-        if hasattr(self, 'db'):
-            self.db.close() 
\ No newline at end of file
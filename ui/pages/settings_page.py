@@ -1,10 +1,61 @@
-from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout
+from PyQt5.QtWidgets import (QWidget, QLabel, QVBoxLayout, QHBoxLayout, QCheckBox,
+                            QPushButton, QFileDialog, QMessageBox)
+from database.bet_database import BetDatabase
+from ui.services.data_service import DataService
 
 class SettingsPage(QWidget):
-    def __init__(self):
+    button_style = """
+        QPushButton {
+            background-color: #2a2a2a;
+            color: white;
+            border: none;
+            padding: 10px;
+            font-size: 14px;
+            border-radius: 10px;
+        }
+        QPushButton:hover {
+            background-color: #3a3a3a;
+        }
+    """
+
+    def __init__(self, data: DataService):
         super().__init__()
+        self.data = data
         layout = QVBoxLayout()
         label = QLabel("Settings Page")
         label.setStyleSheet("font-size: 24px;")
         layout.addWidget(label)
-        self.setLayout(layout) 
\ No newline at end of file
+
+        # Diagnostics: per-query timing (see database/instrumentation.py)
+        diagnostics_label = QLabel("Diagnostics")
+        diagnostics_label.setStyleSheet("font-size: 18px; color: white;")
+        layout.addWidget(diagnostics_label)
+
+        self.query_stats_checkbox = QCheckBox("Record database query timings")
+        self.query_stats_checkbox.setStyleSheet("color: white; font-size: 14px;")
+        self.query_stats_checkbox.setChecked(BetDatabase.is_query_stats_enabled())
+        self.query_stats_checkbox.toggled.connect(BetDatabase.set_query_stats_enabled)
+        layout.addWidget(self.query_stats_checkbox)
+
+        buttons_layout = QHBoxLayout()
+        self.dump_button = QPushButton("Save Query Report...")
+        self.dump_button.setStyleSheet(self.button_style)
+        self.dump_button.clicked.connect(self.handle_dump_query_stats)
+        buttons_layout.addWidget(self.dump_button)
+        buttons_layout.addStretch()
+        layout.addLayout(buttons_layout)
+
+        layout.addStretch()
+        self.setLayout(layout)
+
+    def handle_dump_query_stats(self):
+        """Write the collected query statistics to a JSON file chosen by the user"""
+        path, _ = QFileDialog.getSaveFileName(self, "Save Query Report", "query_stats.json", "JSON (*.json)")
+        if not path:
+            return
+        try:
+            BetDatabase.dump_query_stats(path)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", f"Could not save query report: {e}")
+            return
+        QMessageBox.information(self, "Saved", f"Query report for {len(BetDatabase.get_query_stats())} statements saved to {path}")
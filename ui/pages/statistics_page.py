@@ -1,10 +1,183 @@
-from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout
+from PyQt5.QtWidgets import (QWidget, QLabel, QVBoxLayout, QGridLayout, QTabWidget,
+                            QTableWidget, QTableWidgetItem, QHeaderView)
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont, QColor
+from typing import Dict, Any, List
+from ..components.summary_card import SummaryCard
+from ..utils.formatters import Formatters
+from ui.services.data_service import DataService
 
 class StatisticsPage(QWidget):
-    def __init__(self):
+    # Color constants
+    COLOR_TEXT = "#ffffff"
+    COLOR_BACKGROUND = "#2a2a2a"
+    COLOR_GRIDLINE = "#3a3a3a"
+    COLOR_HEADER = "#1e1e1e"
+
+    # Card labels keyed by StatisticsSummary field
+    CARD_LABELS = {
+        'total_bets': "Total Bets",
+        'win_rate': "Win Rate",
+        'profit': "Total Profit/Loss",
+        'average_odds': "Average Odds",
+        'roi_pct': "ROI",
+        'yield_pct': "Yield",
+        'longest_win_streak': "Longest Win Streak",
+        'longest_losing_streak': "Longest Losing Streak",
+    }
+
+    # Breakdown tabs: grouping key -> tab title
+    GROUP_TABS = {
+        'sport_game': "By Sport/Game",
+        'tournament': "By Tournament",
+        'bet_type': "By Bet Type",
+        'team': "By Team",
+    }
+
+    TABLE_HEADERS = ["Name", "Bets", "Win Rate", "Stake", "Profit/Loss", "Yield"]
+
+    def __init__(self, data: DataService):
         super().__init__()
-        layout = QVBoxLayout()
-        label = QLabel("Statistics Page")
-        label.setStyleSheet("font-size: 24px;")
-        layout.addWidget(label)
-        self.setLayout(layout) 
\ No newline at end of file
+        self.data = data
+        # Statistics are recomputed on show only after bets changed
+        self.stale = True
+        self.data.changed.connect(self.handle_data_changed)
+
+        main_layout = QVBoxLayout()
+        main_layout.setSpacing(15)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+
+        title_label = QLabel("Statistics")
+        title_font = QFont()
+        title_font.setPointSize(32)
+        title_font.setBold(True)
+        title_label.setFont(title_font)
+        title_label.setStyleSheet("color: white;")
+        main_layout.addWidget(title_label)
+
+        # Summary cards grid, four per row
+        cards_layout = QGridLayout()
+        cards_layout.setSpacing(15)
+        cards_layout.setContentsMargins(0, 0, 0, 0)
+        self.cards: Dict[str, SummaryCard] = {}
+        for index, (key, label) in enumerate(self.CARD_LABELS.items()):
+            card = SummaryCard(label, "-")
+            self.cards[key] = card
+            cards_layout.addWidget(card, index // 4, index % 4)
+        main_layout.addLayout(cards_layout)
+
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("color: #888888;")
+        main_layout.addWidget(self.status_label)
+
+        # Breakdown tables
+        self.tabs = QTabWidget()
+        self.tables: Dict[str, QTableWidget] = {}
+        for grouping, title in self.GROUP_TABS.items():
+            table = self.create_table()
+            self.tables[grouping] = table
+            self.tabs.addTab(table, title)
+        main_layout.addWidget(self.tabs)
+
+        self.setLayout(main_layout)
+
+    def create_table(self) -> QTableWidget:
+        """Helper method to create a styled read-only breakdown table"""
+        table = QTableWidget()
+        table.setColumnCount(len(self.TABLE_HEADERS))
+        table.setHorizontalHeaderLabels(self.TABLE_HEADERS)
+        table.setStyleSheet(f"""
+            QTableWidget {{
+                background-color: {self.COLOR_BACKGROUND};
+                color: {self.COLOR_TEXT};
+                border: none;
+                border-radius: 10px;
+                gridline-color: {self.COLOR_GRIDLINE};
+            }}
+            QHeaderView::section {{
+                background-color: {self.COLOR_HEADER};
+                color: {self.COLOR_TEXT};
+                padding: 8px;
+                border: none;
+                font-weight: bold;
+            }}
+            QTableWidget::item {{
+                padding: 8px;
+            }}
+        """)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setSelectionMode(QTableWidget.NoSelection)
+        table.setFocusPolicy(Qt.NoFocus)
+        table.verticalHeader().setVisible(False)
+        return table
+
+    def showEvent(self, event):
+        """Recompute statistics when the page is shown with outdated figures"""
+        super().showEvent(event)
+        if self.stale:
+            self.refresh()
+
+    def handle_data_changed(self, topic: str, payload: Any) -> None:
+        if topic != DataService.BETS:
+            return
+        self.stale = True
+        if self.isVisible():
+            self.refresh()
+
+    def refresh(self) -> None:
+        """Compute statistics on a background worker"""
+        try:
+            # Imported on first use: numpy is not needed until statistics are shown
+            from analytics.statistics import load_statistics
+        except ImportError:
+            self.status_label.setText("Statistics require numpy to be installed.")
+            return
+        self.stale = False
+        self.status_label.setText("Loading statistics...")
+        self.data.submit('statistics', load_statistics, on_result=self._populate, on_error=self._handle_error)
+
+    def _handle_error(self, message: str) -> None:
+        self.stale = True
+        self.status_label.setText(f"Error loading statistics: {message}")
+
+    def _populate(self, statistics: Dict[str, Any]) -> None:
+        """Fill the cards and breakdown tables from load_statistics output"""
+        summary = statistics['summary']
+        self.status_label.setText(
+            f"{summary.settled_bets} settled, {summary.pending_bets} pending, "
+            f"{summary.cash_outs} cashed out"
+        )
+        self.cards['total_bets'].update_value(str(summary.total_bets))
+        self.cards['win_rate'].update_value(f"{summary.win_rate:.1f}%")
+        self.cards['average_odds'].update_value(Formatters.format_odds(summary.average_odds))
+        self.cards['longest_win_streak'].update_value(str(summary.longest_win_streak))
+        self.cards['longest_losing_streak'].update_value(str(summary.longest_losing_streak))
+        self.cards['profit'].update_value(Formatters.format_profit_loss(summary.profit))
+        self.cards['roi_pct'].update_value(f"{summary.roi_pct:+.2f}%")
+        self.cards['yield_pct'].update_value(f"{summary.yield_pct:+.2f}%")
+        for key in ('profit', 'roi_pct', 'yield_pct'):
+            self.cards[key].set_value_color(Formatters.get_profit_loss_color(getattr(summary, key)))
+
+        for grouping, table in self.tables.items():
+            self._fill_table(table, statistics['groups'][grouping])
+
+    def _fill_table(self, table: QTableWidget, rows: List[Dict[str, Any]]) -> None:
+        table.setUpdatesEnabled(False)
+        table.setRowCount(len(rows))
+        for row, group in enumerate(rows):
+            values = [
+                group['name'],
+                str(group['bets']),
+                f"{group['win_rate']:.1f}%",
+                Formatters.format_currency(group['stake']),
+                Formatters.format_profit_loss(group['profit']),
+                f"{group['yield_pct']:+.2f}%",
+            ]
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if column > 0:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                table.setItem(row, column, item)
+            table.item(row, 4).setForeground(QColor(Formatters.get_profit_loss_color(group['profit'])))
+        table.setUpdatesEnabled(True)
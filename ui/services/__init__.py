@@ -0,0 +1,6 @@
+from .db_worker import DatabaseWorker
+from .catalog_snapshot import BetTypeInfo, CatalogSnapshot
+from .data_service import DataService
+from .dashboard_model import DashboardModel
+
+__all__ = ['DatabaseWorker', 'BetTypeInfo', 'CatalogSnapshot', 'DataService', 'DashboardModel']
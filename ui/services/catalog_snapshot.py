@@ -0,0 +1,159 @@
+import json
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from database.bet_database import BetDatabase
+from ..utils.prefix_index import PrefixIndex
+
+
+@dataclass(frozen=True)
+class BetTypeInfo:
+    """A bet type with its options parsed once"""
+    id: int
+    name: str
+    description: Optional[str]
+    option_type: Optional[str] = None       # 'dropdown', 'text' or None (free text)
+    options: Tuple[str, ...] = ()           # dropdown entries, deduplicated in order
+    placeholder: Optional[str] = None       # hint for 'text' options
+
+
+class CatalogSnapshot:
+    """Everything NewBetPage offers for selection, read in one go
+
+    Sports/games, their bet types with parsed options, and usage-ranked
+    prefix indexes of teams, tournaments and locations per sport/game.
+    A snapshot is never changed once built: added bets and catalog items
+    produce a new snapshot (with_bet, with_item) that shares everything
+    except the indexes of the one sport/game they touch, so holders of
+    the previous one are unaffected.
+    """
+
+    # Index key -> dimension table
+    USAGE_TABLES = {
+        'team': 'teams',
+        'tournament': 'tournaments',
+        'location': 'locations',
+    }
+    # Bet fields counted in each index
+    BET_FIELDS = {
+        'team': ('team_a', 'team_b'),
+        'tournament': ('tournament',),
+        'location': ('location',),
+    }
+
+    def __init__(self, sport_games: List[Tuple[int, str, str]],
+                 indexes: Mapping[int, Mapping[str, PrefixIndex]],
+                 bet_types: Mapping[int, Tuple[BetTypeInfo, ...]]) -> None:
+        self.sport_games: Tuple[Tuple[int, str, str], ...] = tuple(sport_games)
+        self.sport_game_ids: Dict[str, int] = {name: sg_id for sg_id, name, _ in self.sport_games}
+        self.categories: Tuple[str, ...] = tuple(sorted({category for _, _, category in self.sport_games}))
+        self._by_category: Dict[str, List[Tuple[int, str, str]]] = defaultdict(list)
+        for sport_game in self.sport_games:
+            self._by_category[sport_game[2]].append(sport_game)
+        self._indexes = indexes
+        self._bet_types = bet_types
+        self._bet_types_by_name: Dict[Tuple[int, str], BetTypeInfo] = {
+            (sg_id, info.name): info for sg_id, infos in bet_types.items() for info in infos
+        }
+
+    @classmethod
+    def load(cls, db: BetDatabase) -> 'CatalogSnapshot':
+        """Read the whole catalog (runs on a worker thread)"""
+        sport_games = db.get_all_sport_games()
+        indexes: Dict[int, Dict[str, PrefixIndex]] = defaultdict(dict)
+        for key, table in cls.USAGE_TABLES.items():
+            usage: Dict[int, List[Tuple[str, int]]] = defaultdict(list)
+            for sport_game_id, _, name, uses in db.get_catalog_usage(table):
+                usage[sport_game_id].append((name, uses))
+            for sport_game_id, _, _ in sport_games:
+                indexes[sport_game_id][key] = PrefixIndex(usage.get(sport_game_id, ()))
+        options: Dict[int, List[tuple]] = defaultdict(list)
+        for bet_type_id, *option in db.get_all_bet_type_options():
+            options[bet_type_id].append(option)
+        bet_types = {
+            sport_game_id: tuple(cls._bet_type_info(row, options.get(row[0], []))
+                                 for row in db.get_bet_types_for_sport_game(sport_game_id))
+            for sport_game_id, _, _ in sport_games
+        }
+        return cls(sport_games, dict(indexes), bet_types)
+
+    @staticmethod
+    def _bet_type_info(bet_type: tuple, options: List[tuple]) -> BetTypeInfo:
+        """BetTypeInfo from a bet_types row and its (option_type, options, placeholder) rows"""
+        bet_type_id, name, description = bet_type
+        if not options:
+            return BetTypeInfo(bet_type_id, name, description)
+        option_type, _, placeholder = options[0]
+        entries = []
+        if option_type == 'dropdown':
+            for _, values, _ in options:
+                if values:
+                    try:
+                        entries.extend(json.loads(values))
+                    except ValueError as e:
+                        print(f"Error parsing options of bet type {name}: {e}")
+        return BetTypeInfo(bet_type_id, name, description, option_type,
+                           tuple(dict.fromkeys(entries)), placeholder)
+
+    # --- Lookups ---
+    def sport_games_in(self, category: str) -> List[Tuple[int, str, str]]:
+        """(id, name, category) of a category's sports/games, by name"""
+        return list(self._by_category.get(category, ()))
+
+    def indexes(self, sport_game_id: int) -> Dict[str, PrefixIndex]:
+        """Prefix indexes of a sport/game keyed 'team', 'tournament' and 'location'; do not modify them"""
+        indexes = self._indexes.get(sport_game_id, {})
+        return {key: indexes.get(key) or PrefixIndex() for key in self.USAGE_TABLES}
+
+    def bet_types(self, sport_game_id: int) -> Tuple[BetTypeInfo, ...]:
+        return self._bet_types.get(sport_game_id, ())
+
+    def bet_type(self, sport_game_id: int, name: str) -> Optional[BetTypeInfo]:
+        return self._bet_types_by_name.get((sport_game_id, name))
+
+    # --- Derived snapshots ---
+    def apply(self, payload: Any) -> Optional['CatalogSnapshot']:
+        """Snapshot after a DataService CATALOG change, or None if it needs a full reload"""
+        if isinstance(payload, dict) and 'table' in payload:
+            return self.with_item(payload['table'], payload['name'], payload['sport_game_id'])
+        if isinstance(payload, dict) and 'sport_game' in payload:
+            return self.with_bet(payload)
+        return None
+
+    def with_item(self, table: str, name: str, sport_game_id: int) -> Optional['CatalogSnapshot']:
+        """Snapshot with a new team, tournament or location ('teams', 'tournaments', 'locations')"""
+        key = next((key for key, usage_table in self.USAGE_TABLES.items() if usage_table == table), None)
+        if key is None or sport_game_id not in self._indexes:
+            return None
+        index = self._indexes[sport_game_id][key]
+        if name in index:
+            return self
+        return self._with_indexes(sport_game_id, {key: [name]}, record_use=False)
+
+    def with_bet(self, bet: Dict[str, Any]) -> Optional['CatalogSnapshot']:
+        """Snapshot counting the teams, tournament and location of a saved bet (DataService.add_bet payload)"""
+        sport_game_id = self.sport_game_ids.get(bet.get('sport_game'))
+        if sport_game_id is None:
+            return None
+        names = {
+            key: [bet[field] for field in fields if bet.get(field)]
+            for key, fields in self.BET_FIELDS.items()
+        }
+        return self._with_indexes(sport_game_id, names, record_use=True)
+
+    def _with_indexes(self, sport_game_id: int, names: Dict[str, List[str]], record_use: bool) -> 'CatalogSnapshot':
+        """Copy of the snapshot where only the changed indexes of one sport/game are copied"""
+        changed = dict(self._indexes[sport_game_id])
+        for key, key_names in names.items():
+            if not key_names:
+                continue
+            index = changed[key].copy()
+            for name in key_names:
+                if record_use:
+                    index.record_use(name)
+                else:
+                    index.add(name)
+            changed[key] = index
+        indexes = dict(self._indexes)
+        indexes[sport_game_id] = changed
+        return CatalogSnapshot(self.sport_games, indexes, self._bet_types)
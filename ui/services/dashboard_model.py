@@ -0,0 +1,104 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List
+from database.bet_database import BetDatabase
+from .data_service import DataService
+
+
+class DashboardModel(QObject):
+    """Totals and recent activity shown on the home page
+
+    load() reads the totals with one aggregate query over daily_rollups
+    plus the newest RECENT_BETS bets. After that every added bet is folded
+    in by apply_bet: O(1) changes to the counters and one push onto a
+    bounded deque, with no further queries.
+    """
+
+    RECENT_BETS = 5
+
+    loaded = pyqtSignal()           # totals and recent activity were (re)read
+    bet_applied = pyqtSignal(dict)  # one bet was folded in; emits its recent-activity entry
+
+    def __init__(self, data: DataService, parent=None) -> None:
+        super().__init__(parent)
+        self.data = data
+        self.total_bets = 0
+        self.wins = 0
+        self.losses = 0
+        self.cash_outs = 0
+        self.profit_loss = 0.0
+        self.recent = deque(maxlen=self.RECENT_BETS)
+        self.is_loaded = False
+
+    @property
+    def active_bets(self) -> int:
+        """Bets without a result yet"""
+        return self.total_bets - self.wins - self.losses - self.cash_outs
+
+    def stats(self) -> Dict[str, Any]:
+        """Keyword arguments for HomePage.update_stats"""
+        return {
+            'total_bets': self.total_bets,
+            'wins': self.wins,
+            'losses': self.losses,
+            'profit_loss': self.profit_loss,
+            'active_bets': self.active_bets,
+        }
+
+    # --- Loading ---
+    def load(self) -> None:
+        self.data.submit('dashboard', self._fetch, self.RECENT_BETS, on_result=self._loaded)
+
+    @staticmethod
+    def _fetch(db: BetDatabase, recent: int) -> tuple:
+        totals = db.get_rollups(group_by=())
+        return (totals[0] if totals else {}), db.get_bets_page(limit=recent)['bets']
+
+    def _loaded(self, data: tuple) -> None:
+        totals, bets = data
+        self.total_bets = totals.get('bets') or 0
+        self.wins = totals.get('wins') or 0
+        self.losses = totals.get('losses') or 0
+        self.cash_outs = totals.get('cash_outs') or 0
+        self.profit_loss = totals.get('profit') or 0.0
+        self.recent.clear()
+        self.recent.extend(self.recent_entry(bet) for bet in bets)
+        self.is_loaded = True
+        self.loaded.emit()
+
+    # --- Incremental updates ---
+    def apply_bet(self, bet: Dict[str, Any]) -> None:
+        """Fold a bet that was just saved (NewBetPage.bet_added) into the totals"""
+        if not self.is_loaded:
+            # The pending load may have run before the bet was saved; read again
+            self.load()
+            return
+        result = bet.get('result') or None
+        self.total_bets += 1
+        if result == BetDatabase.RESULT_WIN:
+            self.wins += 1
+        elif result == BetDatabase.RESULT_LOSE:
+            self.losses += 1
+        elif result == BetDatabase.RESULT_CASHED_OUT:
+            self.cash_outs += 1
+        entry = self.recent_entry(dict(bet, date=bet.get('date') or datetime.now()))
+        self.profit_loss += entry['profit_loss']
+        self.recent.appendleft(entry)
+        self.bet_applied.emit(entry)
+
+    @staticmethod
+    def recent_entry(bet: Dict[str, Any]) -> Dict[str, Any]:
+        """Recent-activity row (the BetListModel shape) for a bet dict"""
+        return {
+            'match': f"{bet.get('team_a') or '—'} vs {bet.get('team_b') or '—'}",
+            'date': bet.get('date'),
+            'amount': bet['stake'],
+            'odds': bet['odds'],
+            'result': bet.get('result') or 'Pending',
+            'profit_loss': BetDatabase.bet_profit(bet.get('result'), bet['stake'], bet['odds'],
+                                                  bet.get('cash_out_amount')),
+        }
+
+    def recent_bets(self) -> List[Dict[str, Any]]:
+        return list(self.recent)
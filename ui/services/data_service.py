@@ -0,0 +1,208 @@
+from PyQt5.QtCore import QObject, pyqtSignal
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+import threading
+from database.bet_database import BetDatabase
+from .db_worker import DatabaseWorker
+from .catalog_snapshot import CatalogSnapshot
+
+
+class DataService(QObject):
+    """Application-wide access to the bets database
+
+    MainWindow owns one instance and hands it to every page, so the whole
+    app shares one BetDatabase (a single writer connection plus per-thread
+    readers, and one set of id caches), one background worker and one
+    cache of catalog reads. The database is opened on first use, normally
+    on the worker thread.
+
+    Background calls receive the database as their first argument:
+    submit('stats', load_statistics, filters) runs load_statistics(db, filters).
+    Writes go through write(), which invalidates cached reads and emits
+    changed(topic, payload) on the GUI thread so pages refresh only what
+    the write touched.
+
+    The catalog is also kept whole in memory as a CatalogSnapshot
+    (load_catalog). CATALOG changes made through this service derive the
+    next snapshot from the announced payload instead of re-reading it, and
+    catalog_changed(snapshot) is emitted before changed(CATALOG, ...).
+    """
+
+    # Change topics
+    BETS = 'bets'          # bets, rollups and ledger; payload is the added bet
+    CATALOG = 'catalog'    # sports, teams, tournaments, locations, bet types and their usage
+
+    changed = pyqtSignal(str, object)
+    catalog_changed = pyqtSignal(object)  # the new CatalogSnapshot
+
+    def __init__(self, db_path: str = "bets.db", parent: Optional[QObject] = None, max_threads: int = 2) -> None:
+        super().__init__(parent)
+        self.db_path = db_path
+        self.worker = DatabaseWorker(self, max_threads)
+        self._db: Optional[BetDatabase] = None
+        self._db_lock = threading.Lock()
+        # (topic, ...) -> result of a cached read; generations detect reads
+        # that were in flight while a write invalidated their topic
+        self._cache: Dict[Tuple[Hashable, ...], Any] = {}
+        self._generations: Dict[str, int] = {}
+        self.catalog: Optional[CatalogSnapshot] = None
+        self._catalog_loading = False
+
+    @property
+    def db(self) -> BetDatabase:
+        """The shared BetDatabase, opened (and migrated) on first access"""
+        if self._db is None:
+            with self._db_lock:
+                if self._db is None:
+                    self._db = BetDatabase(self.db_path)
+        return self._db
+
+    # --- Background calls ---
+    def submit(self, channel: Optional[str], fn: Callable, *args: Any,
+               on_result: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[str], None]] = None) -> int:
+        """Run fn(db, *args) on the worker; a new request on a channel supersedes the previous one"""
+        return self.worker.submit(channel, self._call, fn, args, on_result=on_result, on_error=on_error)
+
+    def cancel(self, channel: str) -> None:
+        self.worker.cancel(channel)
+
+    def _call(self, fn: Callable, args: tuple) -> Any:
+        return fn(self.db, *args)
+
+    def fetch(self, channel: Optional[str], key: Tuple[Hashable, ...], fn: Callable, *args: Any,
+              on_result: Callable[[Any], None],
+              on_error: Optional[Callable[[str], None]] = None) -> None:
+        """Cached submit: key[0] is the topic whose changes invalidate the result
+
+        A cached result is delivered immediately (and supersedes any
+        outstanding request on the channel); otherwise fn(db, *args) runs
+        on the worker and its result is cached for later callers.
+        """
+        if key in self._cache:
+            if channel is not None:
+                self.worker.cancel(channel)
+            on_result(self._cache[key])
+            return
+        generation = self._generations.get(key[0], 0)
+
+        def store(result: Any) -> None:
+            if self._generations.get(key[0], 0) == generation:
+                self._cache[key] = result
+            on_result(result)
+
+        self.submit(channel, fn, *args, on_result=store, on_error=on_error)
+
+    def invalidate(self, topic: str) -> None:
+        """Drop cached reads of a topic"""
+        self._generations[topic] = self._generations.get(topic, 0) + 1
+        for key in [key for key in self._cache if key[0] == topic]:
+            del self._cache[key]
+
+    # --- Catalog ---
+    def load_catalog(self, reload: bool = False) -> None:
+        """Read the catalog snapshot on the worker unless it is loaded or loading (or reload is set)"""
+        if not reload and (self.catalog is not None or self._catalog_loading):
+            return
+        self._catalog_loading = True
+        generation = self._generations.get(self.CATALOG, 0)
+
+        def loaded(snapshot: CatalogSnapshot) -> None:
+            # A CATALOG change after the read started has already asked for another one
+            if self._generations.get(self.CATALOG, 0) == generation:
+                self._catalog_loading = False
+                self._set_catalog(snapshot)
+
+        def failed(message: str) -> None:
+            if self._generations.get(self.CATALOG, 0) == generation:
+                self._catalog_loading = False
+            print(f"Error loading catalog: {message}")
+
+        self.submit('catalog', CatalogSnapshot.load, on_result=loaded, on_error=failed)
+
+    def _set_catalog(self, snapshot: CatalogSnapshot) -> None:
+        if snapshot is not self.catalog:
+            self.catalog = snapshot
+            self.catalog_changed.emit(snapshot)
+
+    def _update_catalog(self, payload: Any) -> None:
+        """Fold an announced CATALOG change into the snapshot, re-reading it if that is not possible"""
+        if self._catalog_loading:
+            # The read in flight may predate the change
+            self.load_catalog(reload=True)
+            return
+        if self.catalog is None:
+            return
+        snapshot = self.catalog.apply(payload)
+        if snapshot is None:
+            self.load_catalog(reload=True)
+        else:
+            self._set_catalog(snapshot)
+
+    # --- Writes ---
+    def write(self, topics: Tuple[str, ...], fn: Callable, *args: Any,
+              payload: Optional[Callable[[Any], Any]] = None,
+              on_result: Optional[Callable[[Any], None]] = None,
+              on_error: Optional[Callable[[str], None]] = None) -> int:
+        """Run a write fn(db, *args) on the worker, then invalidate and announce topics
+
+        changed(topic, payload(result)) is emitted for each topic before
+        on_result runs, so the caller's follow-up reads win over the
+        refreshes other listeners start. Writes are never superseded.
+        """
+        def done(result: Any) -> None:
+            self._announce(topics, payload(result) if payload else result)
+            if on_result:
+                on_result(result)
+
+        return self.submit(None, fn, *args, on_result=done, on_error=on_error)
+
+    def add_bet(self, bet_data: Dict[str, Any],
+                on_result: Optional[Callable[[int], None]] = None,
+                on_error: Optional[Callable[[str], None]] = None) -> None:
+        """Save a bet; on_result gets its id, or -1 if it could not be saved
+
+        New team/tournament/location names and usage counts change with a
+        bet, so CATALOG is announced along with BETS.
+        """
+        def saved(bet_id: int) -> None:
+            if bet_id == -1:
+                if on_result:
+                    on_result(bet_id)
+                return
+            self._announce((self.BETS, self.CATALOG), dict(bet_data, id=bet_id))
+            if on_result:
+                on_result(bet_id)
+
+        self.submit(None, BetDatabase.add_bet, bet_data, on_result=saved, on_error=on_error)
+
+    def add_catalog_item(self, table: str, name: str, sport_game_id: int,
+                         on_result: Optional[Callable[[int], None]] = None,
+                         on_error: Optional[Callable[[str], None]] = None) -> None:
+        """Add a team, tournament or location ('teams', 'tournaments', 'locations')"""
+        add_methods = {
+            'teams': BetDatabase.add_team,
+            'tournaments': BetDatabase.add_tournament,
+            'locations': BetDatabase.add_location,
+        }
+        self.write((self.CATALOG,), add_methods[table], name, sport_game_id,
+                   payload=lambda item_id: {'table': table, 'id': item_id, 'name': name,
+                                            'sport_game_id': sport_game_id},
+                   on_result=on_result, on_error=on_error)
+
+    def _announce(self, topics: Tuple[str, ...], payload: Any) -> None:
+        for topic in topics:
+            self.invalidate(topic)
+            if topic == self.CATALOG:
+                self._update_catalog(payload)
+            self.changed.emit(topic, payload)
+
+    # --- Lifetime ---
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        return self.worker.wait_for_done(msecs)
+
+    def close(self) -> None:
+        """Wait for queued work and close the database"""
+        self.wait_for_done()
+        if self._db is not None:
+            self._db.close()
+            self._db = None
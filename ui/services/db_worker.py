@@ -0,0 +1,111 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+from typing import Any, Callable, Dict, Optional, Tuple
+from itertools import count
+
+
+class _TaskSignals(QObject):
+    """Signals used by a task to hand its outcome back to the GUI thread"""
+    finished = pyqtSignal(int, object)
+    failed = pyqtSignal(int, str)
+
+
+class _DatabaseTask(QRunnable):
+    """A single database call executed on a QThreadPool thread"""
+
+    def __init__(self, request_id: int, fn: Callable, args: tuple, kwargs: dict,
+                 is_current: Callable[[int], bool]) -> None:
+        super().__init__()
+        self.request_id = request_id
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.is_current = is_current
+        self.signals = _TaskSignals()
+
+    def run(self) -> None:
+        # Skip work that was superseded while waiting in the queue
+        if not self.is_current(self.request_id):
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self.signals.failed.emit(self.request_id, str(e))
+        else:
+            self.signals.finished.emit(self.request_id, result)
+
+
+class DatabaseWorker(QObject):
+    """Runs BetDatabase calls on background threads and delivers results on the GUI thread
+
+    Requests are grouped into channels (e.g. 'dropdowns'). Submitting a new
+    request on a channel supersedes the previous one: if it has not started
+    yet it is skipped when its turn comes, otherwise its result is discarded.
+    Requests without a channel (writes) are never superseded.
+    """
+
+    def __init__(self, parent: Optional[QObject] = None, max_threads: int = 2) -> None:
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(max_threads)
+        self._ids = count(1)
+        self._latest: Dict[str, int] = {}
+        self._pending: Dict[int, Tuple[_DatabaseTask, Optional[str], Optional[Callable], Optional[Callable]]] = {}
+        self.cancelled_requests = 0
+
+    def submit(self, channel: Optional[str], fn: Callable, *args: Any,
+               on_result: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[str], None]] = None, **kwargs: Any) -> int:
+        """Queue fn(*args, **kwargs) and return its request id"""
+        request_id = next(self._ids)
+        if channel is not None:
+            self.cancel(channel)
+            self._latest[channel] = request_id
+        task = _DatabaseTask(request_id, fn, args, kwargs, self._is_current)
+        task.signals.finished.connect(self._handle_finished)
+        task.signals.failed.connect(self._handle_failed)
+        self._pending[request_id] = (task, channel, on_result, on_error)
+        self.pool.start(task)
+        return request_id
+
+    def cancel(self, channel: str) -> None:
+        """Drop the outstanding request on a channel, if any"""
+        request_id = self._latest.pop(channel, None)
+        if request_id is None or request_id not in self._pending:
+            return
+        # The pool owns the task; it notices it is no longer pending and returns immediately
+        del self._pending[request_id]
+        self.cancelled_requests += 1
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """Block until all queued requests have run (for shutdown and tests)"""
+        try:
+            return self.pool.waitForDone(msecs)
+        except RuntimeError:
+            # Pool already destroyed along with its parent during shutdown
+            return True
+
+    def _is_current(self, request_id: int) -> bool:
+        return request_id in self._pending
+
+    @pyqtSlot(int, object)
+    def _handle_finished(self, request_id: int, result: Any) -> None:
+        entry = self._take(request_id)
+        if entry and entry[2]:
+            entry[2](result)
+
+    @pyqtSlot(int, str)
+    def _handle_failed(self, request_id: int, message: str) -> None:
+        entry = self._take(request_id)
+        if entry is None:
+            return
+        if entry[3]:
+            entry[3](message)
+        else:
+            print(f"Error in background database request: {message}")
+
+    def _take(self, request_id: int):
+        """Remove a finished request; returns None if it was superseded"""
+        entry = self._pending.pop(request_id, None)
+        if entry and entry[1] is not None and self._latest.get(entry[1]) == request_id:
+            del self._latest[entry[1]]
+        return entry
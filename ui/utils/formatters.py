@@ -45,9 +45,9 @@ class Formatters:
     def get_result_color(cls, result: Optional[str]) -> str:
         """Get the color for a bet result"""
         result = result.lower() if result else ''
-        if result == 'won':
+        if result in ('won', 'win'):
             return cls.COLOR_GREEN
-        elif result == 'lost':
+        elif result in ('lost', 'lose'):
             return cls.COLOR_RED
         return cls.COLOR_YELLOW
     
@@ -0,0 +1,74 @@
+import heapq
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Tuple
+
+
+class PrefixIndex:
+    """Sorted-array prefix index over names, ranked by usage count
+
+    Every word start of a name is a key ("Real Madrid" is found by "re"
+    and by "mad"), so a lookup is a bisect to the first key with the prefix
+    followed by a scan of the matching slice. Matching is case insensitive.
+    """
+
+    def __init__(self, items: Iterable[Tuple[str, int]] = ()) -> None:
+        self._uses: Dict[str, int] = dict(items)
+        # (folded word-start suffix, name) pairs, sorted
+        self._keys: List[Tuple[str, str]] = sorted(
+            key for name in self._uses for key in self._keys_for(name)
+        )
+
+    @staticmethod
+    def _keys_for(name: str) -> List[Tuple[str, str]]:
+        folded = name.casefold()
+        keys = [(folded, name)]
+        for i in range(1, len(folded)):
+            if folded[i - 1] in ' -_./' and not folded[i].isspace():
+                keys.append((folded[i:], name))
+        return keys
+
+    def __len__(self) -> int:
+        return len(self._uses)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._uses
+
+    def copy(self) -> 'PrefixIndex':
+        """An independent copy, without re-sorting the keys"""
+        clone = PrefixIndex()
+        clone._uses = dict(self._uses)
+        clone._keys = list(self._keys)
+        return clone
+
+    def add(self, name: str, uses: int = 0) -> None:
+        """Add a name (no-op if it is already indexed)"""
+        if name in self._uses:
+            return
+        self._uses[name] = uses
+        for key in self._keys_for(name):
+            insort(self._keys, key)
+
+    def record_use(self, name: str) -> None:
+        """Count one more use of a name, adding it if needed"""
+        self.add(name)
+        self._uses[name] += 1
+
+    def top(self, k: int) -> List[str]:
+        """The k most used names"""
+        return heapq.nsmallest(k, self._uses, key=self._rank)
+
+    def search(self, prefix: str, k: int = 10) -> List[str]:
+        """Up to k names with a word starting with prefix, most used first"""
+        prefix = prefix.strip().casefold()
+        if not prefix:
+            return self.top(k)
+        matches = set()
+        for i in range(bisect_left(self._keys, (prefix,)), len(self._keys)):
+            key, name = self._keys[i]
+            if not key.startswith(prefix):
+                break
+            matches.add(name)
+        return heapq.nsmallest(k, matches, key=self._rank)
+
+    def _rank(self, name: str) -> Tuple[int, str]:
+        return -self._uses[name], name.casefold()